@@ -1,34 +1,57 @@
 import os
+import io
 import sys
 import time
+import threading
+import queue
 import json
-import glob
 import wave
+import hashlib
+import numpy as np
 import requests
-import markdown2
-import pyaudio
-import math
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from loguru import logger
+import re
+import random
+import bisect
 import functools
+import concurrent.futures
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 from dotenv import load_dotenv
 from datetime import datetime, timedelta # Keep timedelta if used elsewhere
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
-                             QHBoxLayout, QWidget, QLabel, QTextEdit, QListWidget,
-                             QListWidgetItem, QSplitter, QMessageBox, QLineEdit, QComboBox)
-from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QObject, QRunnable, QThreadPool)
+                             QHBoxLayout, QWidget, QLabel, QTextEdit, QListView,
+                             QSplitter, QMessageBox, QLineEdit, QComboBox)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QObject, QRunnable, QThreadPool,
+                          QAbstractListModel, QModelIndex, QTimer)
 
 # --- Configuration ---
 load_dotenv()
 
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 LLM_API_URL = os.environ.get("LLM_API_URL", "https://api.openai.com/v1/chat/completions")
+RECAP_MODEL = os.environ.get("RECAP_MODEL", "gpt-4o-mini")
 WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
+# Messages below this level are dropped before their arguments are formatted; set LOG_LEVEL=DEBUG for traces
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 
 # Audio settings
-CHUNK_READ_SIZE = 1024
-FORMAT = pyaudio.paInt16
+FORMAT = 8  # pyaudio.paInt16; kept literal so PortAudio is only loaded when recording starts
 CHANNELS = 1
 RATE = 16000
-CHUNK_DURATION_MINUTES = 10
+CHUNK_READ_SIZE = RATE  # One read per second of audio keeps Python-level work (and GIL contention with Qt) low
+STREAM_BUFFER_FRAMES = RATE  # PortAudio-side buffer; the writer thread decouples capture cadence from disk
+WRITER_QUEUE_SIZE = 64
+SILENCE_RMS_THRESHOLD = 150  # int16 RMS below which a chunk is treated as silence and not sent to Whisper
+CHUNK_DURATION_SECONDS = 45
+# "opus" compresses uploads ~10x when soundfile is installed; "wav" always sends raw PCM
+UPLOAD_AUDIO_FORMAT = os.environ.get("UPLOAD_AUDIO_FORMAT", "opus").lower()
+# Tail of the previous chunk's transcript passed to Whisper as context for the next chunk
+WHISPER_PROMPT_TAIL_CHARS = 200
 
 # Folders
 BASE_FOLDER = "meeting_data_v2"
@@ -39,15 +62,68 @@ SUMMARIES_FOLDER = os.path.join(BASE_FOLDER, "summaries")
 NOTES_FOLDER = os.path.join(BASE_FOLDER, "json_notes")
 PROJECT_WIKIS_FOLDER = os.path.join(BASE_FOLDER, "project_wikis")
 HISTORY_FILE = os.path.join(BASE_FOLDER, "meeting_history.json")
+CACHE_FOLDER = os.path.join(BASE_FOLDER, ".cache")  # API responses keyed by content hash
+RECAP_STATE_FILE = os.path.join(CACHE_FOLDER, "recaps.json")  # Last recap per project/week, for incremental updates
 
 # Create all needed folders
 for folder in [WAVE_OUTPUT_FOLDER, TRANSCRIPTS_FOLDER, SUMMARIES_FOLDER, NOTES_FOLDER, # <<< MENTOR_FOLDER REMOVED
-               PROJECT_WIKIS_FOLDER]:
+               PROJECT_WIKIS_FOLDER, CACHE_FOLDER]:
     os.makedirs(folder, exist_ok=True)
 
 API_TIMEOUTS = (15, 180)
 MAX_TRANSCRIPTION_RETRIES = 2
-RETRY_DELAY_SECONDS = 3
+RETRY_DELAY_SECONDS = 1  # Base backoff delay, doubled per attempt with random jitter added
+RETRY_MAX_DELAY_SECONDS = 30
+MAX_CONCURRENT_TRANSCRIPTIONS = int(os.environ.get("MAX_CONCURRENT_TRANSCRIPTIONS", "8"))
+IO_THREAD_STACK_BYTES = 512 * 1024
+# Threads for LLM / wiki requests on top of the transcription slots in the shared network pool
+MAX_CONCURRENT_LLM_REQUESTS = 4
+WHISPER_BATCH_CHUNKS = 4  # Adjacent chunks combined into one Whisper request when re-processing saved audio
+# Transcripts longer than this are analyzed map-reduce style: groups of chunks in parallel, then merged
+MAPREDUCE_MIN_CHARS = 60000
+MAPREDUCE_PART_CHARS = 20000
+MAPREDUCE_MAX_WORKERS = 4
+NOTES_LOAD_MAX_WORKERS = 8  # Notes files read and parsed concurrently for stand-up reports and recaps
+STANDUP_HOURS_BACK = 120
+HISTORY_SELECTION_DEBOUNCE_MS = 120  # Arrow-keying through the history only loads the row the user stops on
+HISTORY_PREVIEW_MAX_CHARS = 512 * 1024  # Longer transcripts are cut off in the history pane; the file itself is untouched
+STREAM_EMIT_INTERVAL_SECONDS = 0.05  # Minimum gap between partial-result UI updates while streaming LLM output
+CACHE_MAX_AGE_DAYS = 30  # Response cache entries older than this are pruned at startup
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # ...and the oldest of the rest go until the cache fits in this
+
+# Set when the window closes. Workers don't get waited on; instead no new API request starts once it is set
+# and streamed responses stop at the next delta, so every worker winds down at its next network stage.
+SHUTDOWN_EVENT = threading.Event()
+
+
+class ShutdownRequested(requests.exceptions.RequestException):
+    """Raised in place of an API request (or mid-stream) once SHUTDOWN_EVENT is set."""
+
+
+class _CancellableSession(requests.Session):
+    def request(self, *args, **kwargs):
+        if SHUTDOWN_EVENT.is_set():
+            raise ShutdownRequested("Application is closing; request not sent.")
+        return super().request(*args, **kwargs)
+
+
+# Shared HTTP session so TCP/TLS connections to the API are reused across requests
+_SESSION = _CancellableSession()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+
+def prewarm_connections(count):
+    """Opens up to `count` pooled keep-alive connections to the API host in the background,
+    so the first concurrent chunk uploads don't each pay for a TCP+TLS handshake."""
+
+    def _touch():
+        try:
+            _SESSION.head(WHISPER_API_URL, timeout=API_TIMEOUTS).close()
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection pre-warm failed: {}", e)
+
+    for _ in range(count):
+        threading.Thread(target=_touch, daemon=True).start()
 
 
 # --- Worker Signals ---
@@ -56,14 +132,585 @@ class WorkerSignals(QObject):
     error = pyqtSignal(str)
     result = pyqtSignal(object)
     transcription_result = pyqtSignal(str, str)
+    transcription_error = pyqtSignal(str, str)
     summarization_result = pyqtSignal(str)
     # mentor_feedback_result = pyqtSignal(str) # <<< REMOVED
     json_notes_result = pyqtSignal(str)
     wiki_suggestion_result = pyqtSignal(str, str)
     recap_result = pyqtSignal(str)
+    summarization_partial = pyqtSignal(str)
+    recap_partial = pyqtSignal(str)
+    wiki_write_status = pyqtSignal(str)
+
+
+# --- Lazy Imports ---
+# pyaudio (PortAudio) and markdown2 are only needed once recording starts or a summary is shown,
+# so they are kept off the startup path.
+_pyaudio = None
+_markdown2 = None
+_soundfile = None
+
+
+def get_pyaudio():
+    global _pyaudio
+    if _pyaudio is None:
+        import pyaudio
+        _pyaudio = pyaudio
+    return _pyaudio
+
+
+def get_markdown2():
+    global _markdown2
+    if _markdown2 is None:
+        import markdown2
+        _markdown2 = markdown2
+    return _markdown2
+
+
+def get_soundfile():
+    """Returns the soundfile module, or None if it (or libsndfile) is not installed."""
+    global _soundfile
+    if _soundfile is None:
+        try:
+            import soundfile
+            _soundfile = soundfile
+        except (ImportError, OSError):  # OSError: the libsndfile shared library is missing
+            _soundfile = False
+    return _soundfile or None
+
+
+# --- JSON Helpers ---
+def json_loads(data):
+    """Parses JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """Serializes obj to a JSON str (2-space indented if requested), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def json_dump_file(obj, path, indent=False):
+    """Writes obj as UTF-8 JSON to path, same layout as json_dumps, without building an intermediate str."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(obj, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+# --- Audio Helpers ---
+def chunk_rms(samples):
+    """Root-mean-square energy of an int16 sample array."""
+    if samples.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(samples.astype(np.float32) ** 2)))
+
+
+def build_wav_bytes(pcm, sample_width):
+    """Wraps raw PCM (bytes or any buffer) in a WAV header in memory, ready to upload."""
+    bio = io.BytesIO()
+    with wave.open(bio, 'wb') as wf:
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(sample_width)
+        wf.setframerate(RATE)
+        wf.writeframes(pcm)
+    return bio.getvalue()
+
+
+def encode_upload_audio(pcm, sample_width):
+    """Encodes int16 PCM for upload: Ogg/Opus when enabled and soundfile is available, otherwise WAV."""
+    soundfile = get_soundfile() if UPLOAD_AUDIO_FORMAT == "opus" and sample_width == 2 else None
+    if soundfile is not None:
+        try:
+            samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, CHANNELS)
+            bio = io.BytesIO()
+            soundfile.write(bio, samples, RATE, format='OGG', subtype='OPUS')
+            return bio.getvalue()
+        except Exception as e:  # e.g. a libsndfile build without Opus support
+            logger.warning("Opus encoding failed, uploading WAV instead: {}", e)
+    return build_wav_bytes(pcm, sample_width)
+
+
+def audio_digest(pcm):
+    """Short BLAKE2b digest of raw PCM (bytes or any contiguous buffer), used to key cached transcripts."""
+    return hashlib.blake2b(pcm, digest_size=16).hexdigest()
+
+
+def upload_audio_type(audio_bytes):
+    """(file extension, content type) of audio produced by encode_upload_audio."""
+    if audio_bytes[:4] == b"OggS":
+        return "ogg", "audio/ogg"
+    return "wav", "audio/wav"
+
+
+def split_pcm_chunks(pcm, samples_per_chunk, count):
+    """Splits int16 PCM into exactly count zero-copy sample arrays of samples_per_chunk (trailing ones may be short or empty)."""
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    return np.array_split(samples, np.arange(1, count) * samples_per_chunk)
+
+
+def read_wav_frames(wav_path, start_frame, nframes):
+    """Reads up to nframes of PCM starting at start_frame. Returns (pcm_bytes, sample_width)."""
+    with wave.open(wav_path, 'rb') as wf:
+        wf.setpos(start_frame)
+        return wf.readframes(nframes), wf.getsampwidth()
+
+
+_CHUNK_INDEX_RE = re.compile(r"_chunk_(\d+)\.wav$")  # "<meeting_id>_chunk_<n>.wav", n counted from 1
+
+
+# --- Response Cache ---
+def cache_key(*parts):
+    """Stable hex key for a request: endpoint, request params and content (or content hashes)."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _read_cache_entry(key):
+    try:
+        with open(os.path.join(CACHE_FOLDER, f"{key}.json"), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def cache_get(key):
+    """Returns the cached value for key, or None on a miss."""
+    raw = _read_cache_entry(key)
+    if raw is None:
+        return None
+    try:
+        return json_loads(raw)["value"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def cache_put(key, value):
+    cache_path = os.path.join(CACHE_FOLDER, f"{key}.json")
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json_dumps({"value": value}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write response cache entry {}: {}", key, e)
+        return
+    # Drop any remembered miss for this key
+    _read_cache_entry.cache_clear()
+
+
+# Entries written by cache_put (and their temp files); anything else in CACHE_FOLDER, like the recap state, is kept
+_CACHE_ENTRY_RE = re.compile(r"^[0-9a-f]{64}\.json(?:\.\d+\.tmp)?$")
+
+
+def _remove_cache_entries(entries):
+    removed = 0
+    for entry in entries:
+        try:
+            os.remove(entry.path)
+            removed += 1
+        except OSError as e:
+            logger.warning("Could not remove response cache entry {}: {}", entry.name, e)
+    _read_cache_entry.cache_clear()
+    return removed
+
+
+def _cache_entries():
+    try:
+        with os.scandir(CACHE_FOLDER) as entries:
+            return [entry for entry in entries if _CACHE_ENTRY_RE.match(entry.name)]
+    except OSError:
+        return []
+
+
+def prune_cache(max_age_days=CACHE_MAX_AGE_DAYS, max_bytes=CACHE_MAX_BYTES):
+    """Drops response cache entries older than max_age_days, then the oldest of the rest until the cache
+    fits in max_bytes. Returns the number of entries removed."""
+    cutoff = time.time() - max_age_days * 86400
+    entries = []
+    for entry in _cache_entries():
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, entry))
+    entries.sort(key=lambda item: item[0], reverse=True)  # Newest first; whatever doesn't fit is dropped
+    kept_bytes = 0
+    expired = []
+    for mtime, size, entry in entries:
+        kept_bytes += size
+        if mtime < cutoff or kept_bytes > max_bytes:
+            expired.append(entry)
+    return _remove_cache_entries(expired) if expired else 0
+
+
+def clear_cache():
+    """Removes every response cache entry. Returns the number of entries removed."""
+    return _remove_cache_entries(_cache_entries())
+
+
+_RECAP_STATE_LOCK = threading.Lock()
+
+
+def load_recap_state(state_key):
+    """Returns the stored {input_hash, bullets, output} entry for a project/week, or None."""
+    with _RECAP_STATE_LOCK:
+        try:
+            with open(RECAP_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json_loads(f.read()).get(state_key)
+        except (OSError, ValueError, AttributeError):
+            return None
+
+
+def save_recap_state(state_key, entry):
+    with _RECAP_STATE_LOCK:
+        try:
+            with open(RECAP_STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json_loads(f.read())
+            if not isinstance(state, dict):
+                state = {}
+        except (OSError, ValueError):
+            state = {}
+        state[state_key] = entry
+        try:
+            with open(RECAP_STATE_FILE, 'w', encoding='utf-8') as f:
+                f.write(json_dumps(state, indent=True))
+        except OSError as e:
+            logger.warning("Could not save recap state: {}", e)
+
+
+# --- Notes Helpers ---
+_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+
+def strip_code_fences(text):
+    """Removes a leading ```/```json fence and a trailing ``` fence (either may be missing), plus surrounding whitespace."""
+    return _FENCE_RE.match(text).group(1)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_notes_cached(notes_path, mtime):
+    """Parses a notes JSON file, unwrapping the legacy {"error", "raw_output"} form. Returns None for an empty file."""
+    # Files whose raw_output could not be repaired are remembered across runs (until the file changes),
+    # so they aren't read and re-parsed on every report
+    status_key = cache_key("notes-unparseable", os.path.abspath(notes_path), mtime)
+    known_error = cache_get(status_key)
+    if known_error is not None:
+        return known_error
+    with open(notes_path, 'rb') as f:
+        notes_content = f.read()  # orjson parses the utf-8 bytes directly, no text decode needed
+    if not notes_content or notes_content.isspace():  # Unlike strip(), isspace() doesn't copy the file contents
+        return None
+    initial_data = json_loads(notes_content)
+    del notes_content  # Only the parsed tree is needed from here on
+    if not (isinstance(initial_data, dict) and
+            initial_data.get("error") == "LLM did not return valid JSON format." and
+            "raw_output" in initial_data):
+        return initial_data
+    cleaned_str = strip_code_fences(initial_data.get("raw_output", ""))
+    if not cleaned_str:
+        logger.error("Cleaned raw_output string is empty in {}.", notes_path)
+        notes_error = {"error_parsing_raw": "Empty raw output"}
+    else:
+        try:
+            return json_loads(cleaned_str)
+        except json.JSONDecodeError as inner_jde:
+            logger.error("Could not parse cleaned raw_output as JSON in {}: {}", notes_path, inner_jde)
+            notes_error = {"error_parsing_raw": f"Failed: {inner_jde}"}
+    cache_put(status_key, notes_error)
+    return notes_error
+
+
+def load_notes_file(notes_path, mtime=None):
+    """Cached notes parse; the file's mtime is part of the key so edited notes are re-read.
+    Pass mtime if the caller has just stat'ed the file. The returned object is shared and must not be modified."""
+    if mtime is None:
+        mtime = os.path.getmtime(notes_path)
+    return _load_notes_cached(notes_path, mtime)
+
+
+def load_notes_files(notes_paths, mtimes=None):
+    """Loads several notes files concurrently with load_notes_file.
+    Returns one (notes_data, exception) pair per path, in order; exception is None on success."""
+    def load(path_and_mtime):
+        try:
+            return load_notes_file(*path_and_mtime), None
+        except Exception as e:
+            return None, e
+
+    jobs = list(zip(notes_paths, mtimes or [None] * len(notes_paths)))
+    if len(jobs) < 2:
+        return [load(job) for job in jobs]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(NOTES_LOAD_MAX_WORKERS, len(jobs))) as pool:
+        return list(pool.map(load, jobs))
+
+
+def format_meeting_notes_md(meeting, notes_data):
+    """Markdown section for one meeting's notes in the stand-up report; empty if the notes have no items."""
+    if not isinstance(notes_data, dict):
+        return f"  *   **Notes Error:** Could not parse JSON notes for this meeting.\n"
+    sections_to_include = (
+        ("Decisions", notes_data.get("decisions", [])),
+        ("Action Items", notes_data.get("action_items", [])),
+        ("Risks", notes_data.get("risks", [])),
+        ("Open Questions", notes_data.get("open_questions", []))
+    )
+    has_content = False
+    meeting_md_parts = []
+    meeting_name = getattr(meeting, 'name', 'Unknown Meeting')
+    meeting_project = getattr(meeting, 'project_name', 'Unknown Project')
+    meeting_date = getattr(meeting, 'date', 'Unknown Date')
+    for title, items in sections_to_include:
+        if items and isinstance(items, list) and len(items) > 0:
+            has_content = True
+            meeting_md_parts.append(f"  *   **{title}:**\n")
+            try:
+                meeting_md_parts.append("".join(["      *   " + str(item).replace('\n', ' ') + "\n" for item in items]))
+                continue
+            except Exception:
+                pass  # Redo the section item by item so only the bad items get the placeholder
+            for item_index, item in enumerate(items):
+                try:
+                    item_text = str(item).replace('\n', ' ')
+                    meeting_md_parts.append(f"      *   {item_text}\n")
+                except Exception as str_e:
+                    logger.error("Could not convert item {} in section '{}' of meeting {} to string: {}", item_index, title, meeting_name, str_e)
+                    meeting_md_parts.append(f"      *   [Error converting item to string]\n")
+    if not has_content:
+        logger.debug("No content found in specified sections for {}", meeting_name)
+        return ""
+    return f"### {meeting_name} ({meeting_project} - {meeting_date})\n" + "".join(meeting_md_parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_markdown_cached(md_path, mtime_ns):
+    with open(md_path, 'r', encoding='utf-8') as f:
+        return get_markdown2().markdown(f.read())
+
+
+def render_markdown_file(md_path):
+    """HTML for a markdown file, cached by path and mtime so re-selecting a meeting doesn't re-parse its summary."""
+    return _render_markdown_cached(md_path, os.stat(md_path).st_mtime_ns)
+
+
+# --- Wiki Helpers ---
+# Wiki filenames keep letters, digits, spaces and '-'; every other ASCII character becomes '_'
+_SAFE_NAME_TABLE = {i: (chr(i) if chr(i).isalnum() or chr(i) in ' -' else '_') for i in range(128)}
+
+
+def _parse_header(line):
+    """(level, title, spaced) for a markdown heading line, or None. spaced is True when whitespace follows the
+    run of '#', which "any heading"/H2/H3 checks require; title matching ('##Goals' included) doesn't."""
+    stripped = line.lstrip()
+    if not stripped.startswith('#'):
+        return None
+    level = len(stripped) - len(stripped.lstrip('#'))
+    rest = stripped[level:]
+    return level, rest.strip(), rest[:1].isspace()
+
+
+def _is_heading(header, level=None):
+    return header is not None and header[2] and (level is None or header[0] == level)
+
+
+def _is_titled(header, title_lower, level=None):
+    """True for a heading whose title equals title_lower case-insensitively, at any level unless one is given."""
+    return header is not None and header[1].lower() == title_lower and (level is None or header[0] == level)
+
+
+def _wiki_file_version(wiki_file_path):
+    """(mtime_ns, size) of the wiki, the cache key below. Size catches a rewrite within one mtime tick."""
+    st = os.stat(wiki_file_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _clear_wiki_caches():
+    """Called after every wiki write, so a rewrite that keeps both mtime and size still isn't served stale."""
+    _wiki_lines_cached.cache_clear()
+    _wiki_section_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _wiki_lines_cached(wiki_file_path, file_version):
+    """The wiki's lines, read once per (path, version) however many sections are looked up. Shared; don't modify."""
+    with open(wiki_file_path, 'r', encoding='utf-8') as f:
+        return tuple(f.readlines())
+
+
+@functools.lru_cache(maxsize=64)
+def _wiki_section_cached(wiki_file_path, file_version, section_title):
+    """Stripped body of a wiki section, or None if the file has no such heading.
+    file_version is part of the key, so a rewritten wiki is parsed again."""
+    lines = _wiki_lines_cached(wiki_file_path, file_version)
+    section_content_lines = []
+    in_section = False
+    title_lower = section_title.lower()
+    for line in lines:
+        header = _parse_header(line)
+        is_target = _is_titled(header, title_lower)
+        if not in_section and is_target:
+            in_section = True
+            continue
+        if in_section:
+            if _is_heading(header, 2) and not is_target:
+                break
+            section_content_lines.append(line)
+    if not in_section:
+        return None
+    return "".join(section_content_lines).strip()
+
+
+def _wiki_section_unchanged(lines, section_title, new_section_content):
+    """True when replacing section_title with new_section_content would leave the wiki byte-identical:
+    one heading with that title, already written canonically, whose body is exactly the new content."""
+    title_lower = section_title.lower()
+    start = None
+    for i, line in enumerate(lines):
+        if _is_titled(_parse_header(line), title_lower):
+            if start is not None:
+                return False  # The rewrite drops later duplicates of the section
+            start = i
+    if start is None or lines[start] != f"{'#' * _parse_header(lines[start])[0]} {section_title}\n":
+        return False
+    end = start + 1
+    while end < len(lines) and not _is_heading(_parse_header(lines[end])):
+        end += 1
+    return "".join(lines[start + 1:end]) == new_section_content
+
+
+# --- Prompt Templates ---
+_SUMMARY_PROMPT_TMPL = (
+    "Analyze the following meeting transcript and provide a concise summary in bullet points, highlighting key topics, decisions, and action items.\n\nTranscript:\n{text}")
+_JSON_PROMPT_TMPL = (
+    "Analyze the following meeting transcript. Extract key information and format it ONLY as a JSON object.\n"
+    "The JSON object must have these exact keys: 'decisions', 'action_items', 'risks', 'open_questions'.\n"
+    "Each key should map to a list of strings.\n"
+    "*   'decisions': List key decisions made.\n"
+    "*   'action_items': List specific tasks or actions agreed upon.\n"
+    "*   'risks': List potential risks or blockers mentioned.\n"
+    "*   'open_questions': List questions raised that were left unanswered or need follow-up.\n"
+    "If no items are found for a category, use an empty list [].\n"
+    "Do NOT include any text before or after the JSON object. Output only the valid JSON.\n\n"
+    "Transcript:\n```\n{transcript_text}\n```\n\n"
+    "JSON Output:"
+)
+_ANALYSIS_PROMPT_TMPL = (
+    "Analyze the following meeting transcript and return a JSON object with these fields:\n"
+    "*   'summary': A concise summary in Markdown bullet points, highlighting key topics, decisions, and action items.\n"
+    "*   'decisions': List key decisions made.\n"
+    "*   'action_items': List specific tasks or actions agreed upon.\n"
+    "*   'risks': List potential risks or blockers mentioned.\n"
+    "*   'open_questions': List questions raised that were left unanswered or need follow-up.\n"
+    "If no items are found for a category, use an empty list [].\n\n"
+    "Transcript:\n```\n{text}\n```"
+)
+_MERGE_SUMMARIES_PROMPT_TMPL = (
+    "The following are bullet-point summaries of consecutive parts of one meeting, in order.\n"
+    "Merge them into a single concise summary in bullet points, highlighting key topics, decisions, and action items. "
+    "Remove repetition across parts.\n\n"
+    "{partial_summaries}"
+)
+_RECAP_PROMPT_TMPL = (
+    "You are an assistant summarizing weekly project activity for an executive audience. "
+    "Review the following aggregated bullet points for project '{project_name}' during the week '{week_str}'.\n"
+    "Rewrite these points into a concise, professional, executive-friendly narrative summary (1-3 short paragraphs).\n"
+    "Focus on key accomplishments, decisions, and any critical risks or open questions that need visibility.\n"
+    "Avoid jargon where possible. Maintain a positive but realistic tone.\n\n"
+    "--- Aggregated Notes ---\n"
+    "{aggregated_bullets_text}\n\n"
+    "--- Executive Narrative Summary ---"
+)
+_RECAP_UPDATE_PROMPT_TMPL = (
+    "You are an assistant summarizing weekly project activity for an executive audience. "
+    "Below is the existing executive narrative for project '{project_name}' during the week '{week_str}', "
+    "followed by new bullet points recorded since it was written.\n"
+    "Integrate the new points into the narrative, keeping it a concise, professional, executive-friendly summary (1-3 short paragraphs).\n"
+    "Focus on key accomplishments, decisions, and any critical risks or open questions that need visibility.\n"
+    "Avoid jargon where possible. Maintain a positive but realistic tone.\n\n"
+    "--- Existing Narrative ---\n"
+    "{previous_recap}\n\n"
+    "--- New Bullets to Incorporate ---\n"
+    "{delta_bullets_text}\n\n"
+    "--- Updated Executive Narrative Summary ---"
+)
+_WIKI_DAILY_LOG_INSTRUCTIONS_TMPL = (
+    "Based ONLY on the new information from the recent meeting (details below), "
+    "generate a CONCISE new entry for the 'Daily Log' for project '{project_name}'. "
+    "The entry should summarize key activities, decisions, and next steps from this specific meeting. "
+    "Format the entry as a few bullet points. "
+    "If the meeting has no new log-worthy updates, output ONLY the exact phrase 'No new log entries from this meeting.'"
+)
+_WIKI_DAILY_LOG_OUTPUT = (
+    "Output ONLY the bullet points for the new log entry. "
+    "If no new log entries, output ONLY the exact phrase 'No new log entries from this meeting.'"
+)
+_WIKI_SECTION_INSTRUCTIONS_TMPL = (
+    "You are updating the '{target_section_title}' section of the project wiki for '{project_name}'.\n"
+    "Based ONLY on the new information from the recent meeting (details below), suggest a revised version of the ENTIRE '{target_section_title}' section.\n"
+    "If the meeting introduced new relevant points, add them. "
+    "If the meeting clarified or changed existing points, reflect those changes. "
+    "If the meeting made some existing points obsolete or less relevant, remove or update them accordingly. "
+    "The goal is to have an up-to-date section based on the latest meeting.\n"
+    "If no changes to the '{target_section_title}' section are warranted based on this meeting, output the original 'Current Section Content' unchanged."
+)
+_WIKI_SECTION_OUTPUT_TMPL = (
+    "Output ONLY the complete, revised text for the '{target_section_title}' section. "
+    "Do not add any conversational preamble, explanation, or the markdown section header itself (like '## {target_section_title}'). "
+    "Just provide the content that should go *under* that header."
+)
+_WIKI_PROMPT_TMPL = (
+    "You are an AI assistant helping to maintain a project wiki.\n"
+    "Project: {project_name}\n"
+    "Target Section to Update: {target_section_title}\n\n"
+    "Current '{target_section_title}' Section Content (if any - for 'Daily Log' this is less relevant, focus on new entry):\n"
+    "```\n{current_section_content}\n```\n\n"
+    "Information from Recent Meeting:\n"
+    "```\n{meeting_info_text}\n```\n\n"
+    "Instructions:\n{specific_instructions}\n\n"
+    "{output_instructions}"
+)
 
 
 # --- API Classes ---
+def stream_chat_completion(api_url, headers, data, on_partial=None):
+    """Posts a chat completion with stream=True and returns the full content.
+
+    on_partial, if given, is called with the running text at most every
+    STREAM_EMIT_INTERVAL_SECONDS while the SSE deltas arrive."""
+    content_parts = []
+    last_emit = 0.0
+    with _SESSION.post(api_url, headers=headers, json={**data, "stream": True}, timeout=API_TIMEOUTS,
+                       stream=True) as response:
+        response.raise_for_status()
+        # SSE is UTF-8 by spec; without a charset requests would decode it as ISO-8859-1
+        response.encoding = "utf-8"
+        for line in response.iter_lines(decode_unicode=True):
+            if SHUTDOWN_EVENT.is_set():
+                raise ShutdownRequested("Application is closing; stream abandoned.")
+            if not line or not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            choices = json_loads(payload).get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+            if not delta:
+                continue
+            content_parts.append(delta)
+            now = time.monotonic()
+            if on_partial is not None and now - last_emit >= STREAM_EMIT_INTERVAL_SECONDS:
+                on_partial("".join(content_parts))
+                last_emit = now
+    return "".join(content_parts)
+
+
 class WhisperTranscriber:
     """Handles transcription using OpenAI's Whisper API with retry logic"""
 
@@ -71,33 +718,102 @@ class WhisperTranscriber:
         self.api_key = api_key
         self.api_url = WHISPER_API_URL
 
-    def transcribe(self, audio_file_path):
-        if not self.api_key: print("Error: Whisper API key is missing."); return None
-        headers = {"Authorization": f"Bearer {self.api_key}"};
+    def transcribe(self, audio_bytes, file_name, prompt=None):
+        """Transcribes in-memory audio from encode_upload_audio. file_name is only used for the upload and logging."""
+        if not self.api_key: logger.error("Whisper API key is missing."); return None
         data = {"model": "whisper-1"}
+        if prompt:
+            data["prompt"] = prompt
+        key = cache_key(self.api_url, data, audio_digest(audio_bytes))
+        cached = cache_get(key)
+        if cached is not None:
+            logger.info("Transcription cache hit for {}", file_name)
+            return cached
+        extension, content_type = upload_audio_type(audio_bytes)
+        response_data = self._post_with_retries(f"{os.path.splitext(file_name)[0]}.{extension}",
+                                                lambda: io.BytesIO(audio_bytes), data, content_type)
+        if response_data is None:
+            return None
+        try:
+            text = response_data["text"]
+        except (KeyError, TypeError):
+            logger.error("Unexpected response format from Whisper API. Response: {}", response_data)
+            return None
+        if text and not text.isspace():  # An empty reply may be transient; caching it would make Retry repeat it
+            cache_put(key, text)
+        return text
+
+    def transcribe_batch(self, audio_bytes, boundaries, prompt=None):
+        """Transcribes several adjacent chunks, combined into one upload, in a single request.
+
+        boundaries holds the end offset (in seconds) of each chunk; the text is split back along them.
+        Returns a list of transcripts, one per chunk, or None on failure."""
+        if not self.api_key: logger.error("Whisper API key is missing."); return None
+        data = {"model": "whisper-1", "response_format": "verbose_json"}
+        if prompt:
+            data["prompt"] = prompt
+        key = cache_key(self.api_url, data, audio_digest(audio_bytes))
+        cached = cache_get(key)
+        if cached is not None:
+            logger.info("Batch transcription cache hit for {} chunks", len(boundaries))
+            return cached
+        extension, content_type = upload_audio_type(audio_bytes)
+        response_data = self._post_with_retries(f"batch.{extension}", lambda: io.BytesIO(audio_bytes), data,
+                                                content_type)
+        if response_data is None:
+            return None
+        try:
+            segments = response_data["segments"]
+            chunk_texts = [[] for _ in boundaries]
+            for segment in segments:
+                midpoint = (segment["start"] + segment["end"]) / 2
+                chunk_index = min(bisect.bisect_right(boundaries, midpoint), len(boundaries) - 1)
+                chunk_texts[chunk_index].append(segment["text"].strip())
+        except (KeyError, TypeError) as e:
+            logger.error("Unexpected verbose_json format from Whisper API ({}). Response: {}", e, response_data)
+            return None
+        texts = [" ".join(parts) for parts in chunk_texts]
+        if all(text and not text.isspace() for text in texts):
+            cache_put(key, texts)
+        return texts
+
+    def cached_chunk_transcript(self, pcm_digest):
+        """Transcript stored for a chunk with exactly these samples (see audio_digest), or None."""
+        return cache_get(self._chunk_cache_key(pcm_digest))
+
+    def store_chunk_transcript(self, pcm_digest, text):
+        if text and not text.isspace():
+            cache_put(self._chunk_cache_key(pcm_digest), text)
+
+    def _chunk_cache_key(self, pcm_digest):
+        # Keyed on the raw samples rather than the upload, so live chunks, batched re-processing of the
+        # saved recording and any upload encoding all share entries
+        return cache_key(self.api_url, "whisper-1", "chunk", pcm_digest)
+
+    def _post_with_retries(self, file_name, open_audio, data, content_type="audio/wav"):
+        """POSTs an audio upload to Whisper, retrying transient failures. Returns the decoded JSON body or None."""
+        headers = {"Authorization": f"Bearer {self.api_key}"};
         last_exception = None
         for attempt in range(MAX_TRANSCRIPTION_RETRIES + 1):
-            print(
-                f"Attempting to transcribe (Attempt {attempt + 1}/{MAX_TRANSCRIPTION_RETRIES + 1}): {os.path.basename(audio_file_path)}")
+            logger.info("Attempting to transcribe (Attempt {}/{}): {}", attempt + 1, MAX_TRANSCRIPTION_RETRIES + 1, file_name)
             response = None
             try:
-                with open(audio_file_path, "rb") as audio_file:
-                    files = {"file": (os.path.basename(audio_file_path), audio_file)}
-                    response = requests.post(self.api_url, headers=headers, files=files, data=data,
-                                             timeout=API_TIMEOUTS)
-                    print(f"Transcription response status (Attempt {attempt + 1}): {response.status_code}")
-                    if response.status_code in [500, 502, 503, 504, 429]: print(
-                        f"Retryable error {response.status_code} encountered."); response.raise_for_status()
-                    if 400 <= response.status_code < 500 and response.status_code != 429: print(
-                        f"Client error {response.status_code}, not retrying. Response: {response.text}"); return None
+                with open_audio() as audio_file:
+                    # Streams the file into the request body instead of building the whole multipart payload in memory
+                    encoder = MultipartEncoder(fields={**data, "file": (file_name, audio_file, content_type)})
+                    response = _SESSION.post(self.api_url, headers={**headers, "Content-Type": encoder.content_type},
+                                             data=encoder, timeout=API_TIMEOUTS)
+                    logger.info("Transcription response status (Attempt {}): {}", attempt + 1, response.status_code)
+                    if response.status_code in [500, 502, 503, 504, 429]: logger.warning("Retryable error {} encountered.", response.status_code); response.raise_for_status()
+                    if 400 <= response.status_code < 500 and response.status_code != 429: logger.warning("Client error {}, not retrying. Response: {}", response.status_code, response.text); return None
                     response.raise_for_status()
-                    result = response.json()["text"]
-                    print(f"Transcription success (Attempt {attempt + 1}) for {os.path.basename(audio_file_path)}");
+                    result = json_loads(response.content)
+                    logger.info("Transcription success (Attempt {}) for {}", attempt + 1, file_name);
                     return result
             except requests.exceptions.Timeout as e:
-                print(f"Error: Transcription request timed out (Attempt {attempt + 1})."); last_exception = e
+                logger.error("Transcription request timed out (Attempt {}).", attempt + 1); last_exception = e
             except requests.exceptions.RequestException as e:
-                print(f"Error during transcription request (Attempt {attempt + 1}): {e}");
+                logger.error("Error during transcription request (Attempt {}): {}", attempt + 1, e);
                 last_exception = e
                 is_retryable_http = False
                 status_code = -1
@@ -106,38 +822,38 @@ class WhisperTranscriber:
                     if status_code in [429, 500, 502, 503, 504]:
                         is_retryable_http = True
                     else:
-                        print(f"Non-retryable HTTP error {status_code}. Giving up."); return None
+                        logger.error("Non-retryable HTTP error {}. Giving up.", status_code); return None
                 is_connection_error = isinstance(e, (
                 requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError))
-                if not is_retryable_http and not is_connection_error: print(
-                    f"Non-retryable request error encountered. Giving up."); return None
+                if not is_retryable_http and not is_connection_error: logger.error("Non-retryable request error encountered. Giving up."); return None
             except FileNotFoundError as e:
-                print(f"Error: Audio file not found: {audio_file_path}"); return None
-            except KeyError as e:
-                resp_text = "N/A"
-                try:
-                    if response is not None and hasattr(response, 'text'): resp_text = response.text
-                except Exception:
-                    pass
-                print(
-                    f"Error: Unexpected response format from Whisper API (Attempt {attempt + 1}). Response: {resp_text}");
-                return None
+                logger.error("Audio file not found: {}", file_name); return None
             except Exception as e:
-                print(
-                    f"An unexpected error occurred during transcription attempt {attempt + 1}: {e}"); last_exception = e; print(
-                    "Unexpected error, giving up."); return None
+                logger.error("An unexpected error occurred during transcription attempt {}: {}", attempt + 1, e); last_exception = e; logger.error("Unexpected error, giving up."); return None
             if attempt < MAX_TRANSCRIPTION_RETRIES:
-                print(f"Retrying in {RETRY_DELAY_SECONDS} seconds...")
-                time.sleep(RETRY_DELAY_SECONDS)
+                delay = self._retry_delay(attempt, response)
+                logger.warning("Retrying in {:.1f} seconds...", delay)
+                SHUTDOWN_EVENT.wait(delay)  # Closing the app cuts the backoff short; the retry then isn't sent
             else:
-                print(
-                    f"Max retries ({MAX_TRANSCRIPTION_RETRIES}) reached for {os.path.basename(audio_file_path)}. Giving up.")
+                logger.error("Max retries ({}) reached for {}. Giving up.", MAX_TRANSCRIPTION_RETRIES, file_name)
                 if last_exception:
-                    print(f"Last error: {last_exception}")
+                    logger.error("Last error: {}", last_exception)
                 return None
-        print("Fell through retry loop without success or explicit failure.");
+        logger.error("Fell through retry loop without success or explicit failure.");
         return None
 
+    @staticmethod
+    def _retry_delay(attempt, response):
+        """Server-requested Retry-After if present, otherwise exponential backoff with jitter."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(RETRY_MAX_DELAY_SECONDS, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; use our own backoff
+        # Jitter keeps parallel workers that hit the same 429 from retrying in lockstep
+        return min(RETRY_MAX_DELAY_SECONDS, RETRY_DELAY_SECONDS * (2 ** attempt)) + random.uniform(0, 1)
+
 
 class LLMSummarizer:
     """Handles summarization using OpenAI's GPT API (Summary ONLY)"""
@@ -145,28 +861,87 @@ class LLMSummarizer:
     def __init__(self, api_key):
         self.api_key = api_key; self.api_url = LLM_API_URL
 
-    def summarize(self, text):
-        if not self.api_key: print("Error: LLM API key is missing for summarization."); return None
-        if not text or text.isspace(): print("Warning: Attempted to summarize empty text."); return ""
+    def summarize(self, text, on_partial=None):
+        if not self.api_key: logger.error("LLM API key is missing for summarization."); return None
+        if not text or text.isspace(): logger.warning("Attempted to summarize empty text."); return ""
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        prompt = (
-            f"Analyze the following meeting transcript and provide a concise summary in bullet points, highlighting key topics, decisions, and action items.\n\nTranscript:\n{text}")
+        prompt = _SUMMARY_PROMPT_TMPL.format(text=text)
         data = {"model": "gpt-4o", "messages": [{"role": "system",
                                                  "content": "You are a helpful assistant skilled at analyzing meeting transcripts and creating concise bullet-point summaries."},
                                                 {"role": "user", "content": prompt}], "temperature": 0.5}
+        key = cache_key(self.api_url, data)
+        cached = cache_get(key)
+        if cached is not None: logger.info("Summarization cache hit."); return cached
+        try:
+            summary = stream_chat_completion(self.api_url, headers, data, on_partial).strip()
+            cache_put(key, summary)
+            return summary
+        except requests.exceptions.Timeout:
+            logger.error("Summarization request timed out."); return None
+        except requests.exceptions.RequestException as e:
+            logger.error("Error during summarization request: {}", e)
+            if e.response is not None: logger.info("Response content: {}", e.response.text)
+            return None
+        except json.JSONDecodeError as e:
+            logger.error("Could not decode streamed summarization chunk: {}", e); return None
+        except Exception as e:
+            logger.error("An unexpected error occurred during summarization: {}", e); return None
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class LLMJsonExtractor:
+    """Uses an LLM to extract structured notes from a transcript into JSON."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.api_url = LLM_API_URL
+
+    def extract_notes(self, transcript_text):
+        if not self.api_key: logger.error("LLM API key is missing for JSON extraction."); return None
+        if not transcript_text or transcript_text.isspace():
+            logger.warning("Attempted JSON extraction from empty transcript.")
+            return json_dumps({"decisions": [], "action_items": [], "risks": [], "open_questions": []}, indent=True)
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        prompt = _JSON_PROMPT_TMPL.format(transcript_text=transcript_text)
+        data = {"model": RECAP_MODEL, "messages": [{"role": "system",
+                                                 "content": "You are an AI assistant that extracts specific information from meeting transcripts and outputs ONLY valid JSON."},
+                                                {"role": "user", "content": prompt}], "temperature": 0.2}
+        key = cache_key(self.api_url, data)
+        cached = cache_get(key)
+        if cached is not None: logger.info("JSON extraction cache hit."); return cached
         response = None;
         response_data = None
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS);
+            response = _SESSION.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS);
             response.raise_for_status()
-            response_data = response.json();
-            return response_data["choices"][0]["message"]["content"].strip()
+            response_data = json_loads(response.content)
+            response_content = response_data["choices"][0]["message"]["content"].strip()
+            json_start = response_content.find('{')
+            if json_start == -1:
+                logger.warning("LLM output for JSON notes doesn't look like JSON: {}", response_content)
+                error_json = json_dumps(
+                    {"error": "LLM did not return valid JSON format.", "raw_output": response_content}, indent=True);
+                return error_json
+            try:
+                # Validates in one pass and drops anything around the object (``` fences, trailing prose)
+                _, json_end = _JSON_DECODER.raw_decode(response_content, json_start)
+                notes_json = response_content[json_start:json_end]
+                cache_put(key, notes_json)
+                return notes_json
+            except json.JSONDecodeError as json_e:
+                logger.error("Could not decode LLM JSON output: {}", json_e);
+                logger.info("LLM Raw Output: {}", response_content)
+                error_json = json_dumps(
+                    {"error": f"LLM output failed JSON parsing: {json_e}", "raw_output": response_content}, indent=True);
+                return error_json
         except requests.exceptions.Timeout:
-            print("Error: Summarization request timed out."); return None
+            logger.error("JSON extraction request timed out."); return None
         except requests.exceptions.RequestException as e:
-            print(f"Error during summarization request: {e}")
+            logger.error("Error during JSON extraction request: {}", e)
             try:
-                if response is not None and hasattr(response, 'text'): print(f"Response content: {response.text}")
+                if response is not None and hasattr(response, 'text'): logger.info("Response content: {}", response.text)
             except Exception:
                 pass
             return None
@@ -179,68 +954,82 @@ class LLMSummarizer:
                     response_info = response.text
             except Exception:
                 pass
-            print(f"Error: Unexpected response format from LLM API ({e}). Response: {response_info}");
+            logger.error("Unexpected LLM API response format ({}). Response: {}", e, response_info);
             return None
         except Exception as e:
-            print(f"An unexpected error occurred during summarization: {e}"); return None
+            logger.error("An unexpected error occurred during JSON extraction: {}", e); return None
 
 
-class LLMJsonExtractor:
-    """Uses an LLM to extract structured notes from a transcript into JSON."""
+NOTES_KEYS = ("decisions", "action_items", "risks", "open_questions")
+MEETING_ANALYSIS_SCHEMA = {
+    "name": "meeting_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            **{key: {"type": "array", "items": {"type": "string"}} for key in NOTES_KEYS},
+        },
+        "required": ["summary", *NOTES_KEYS],
+        "additionalProperties": False,
+    },
+}
+
+
+class LLMMeetingAnalyzer:
+    """Produces the bullet summary and the structured JSON notes from a transcript in a single LLM call."""
 
     def __init__(self, api_key):
         self.api_key = api_key
         self.api_url = LLM_API_URL
-
-    def extract_notes(self, transcript_text):
-        if not self.api_key: print("Error: LLM API key is missing for JSON extraction."); return None
-        if not transcript_text or transcript_text.isspace():
-            print("Warning: Attempted JSON extraction from empty transcript.")
-            return json.dumps({"decisions": [], "action_items": [], "risks": [], "open_questions": []}, indent=2)
+        # Map-step analyses started while the meeting is still being transcribed, keyed by part text
+        self._part_pool = concurrent.futures.ThreadPoolExecutor(max_workers=MAPREDUCE_MAX_WORKERS)
+        self._part_futures = {}
+        self._part_lock = threading.Lock()
+
+    def analyze(self, text, model="gpt-4o"):
+        """Returns a dict with 'summary' plus the four notes lists, or None if the call or parsing failed."""
+        if not self.api_key: logger.error("LLM API key is missing for meeting analysis."); return None
+        if not text or text.isspace():
+            logger.warning("Attempted meeting analysis of empty transcript.")
+            return {"summary": "", **{key: [] for key in NOTES_KEYS}}
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        prompt = (
-            f"Analyze the following meeting transcript. Extract key information and format it ONLY as a JSON object.\n"
-            f"The JSON object must have these exact keys: 'decisions', 'action_items', 'risks', 'open_questions'.\n"
-            f"Each key should map to a list of strings.\n"
-            f"*   'decisions': List key decisions made.\n"
-            f"*   'action_items': List specific tasks or actions agreed upon.\n"
-            f"*   'risks': List potential risks or blockers mentioned.\n"
-            f"*   'open_questions': List questions raised that were left unanswered or need follow-up.\n"
-            f"If no items are found for a category, use an empty list [].\n"
-            f"Do NOT include any text before or after the JSON object. Output only the valid JSON.\n\n"
-            f"Transcript:\n```\n{transcript_text}\n```\n\n"
-            f"JSON Output:"
-        )
-        data = {"model": "gpt-4o", "messages": [{"role": "system",
-                                                 "content": "You are an AI assistant that extracts specific information from meeting transcripts and outputs ONLY valid JSON."},
-                                                {"role": "user", "content": prompt}], "temperature": 0.2}
+        prompt = _ANALYSIS_PROMPT_TMPL.format(text=text)
+        data = {"model": model, "messages": [{"role": "system",
+                                                 "content": "You are a helpful assistant skilled at analyzing meeting transcripts. You output ONLY valid JSON matching the requested schema."},
+                                                {"role": "user", "content": prompt}], "temperature": 0.3,
+                "response_format": {"type": "json_schema", "json_schema": MEETING_ANALYSIS_SCHEMA}}
+        cache_id = cache_key(self.api_url, data)
+        cached = cache_get(cache_id)
+        if cached is not None: logger.info("Meeting analysis cache hit."); return cached
         response = None;
         response_data = None
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS);
+            response = _SESSION.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS);
             response.raise_for_status()
-            response_data = response.json()
-            response_content = response_data["choices"][0]["message"]["content"].strip()
-            if not (response_content.startswith('{') and response_content.endswith('}')):
-                print(f"Warning: LLM output for JSON notes doesn't look like JSON: {response_content}")
-                error_json = json.dumps(
-                    {"error": "LLM did not return valid JSON format.", "raw_output": response_content}, indent=2);
-                return error_json
+            response_data = json_loads(response.content)
+            # Unwrap a fenced block if the model added one despite the schema
+            response_content = strip_code_fences(response_data["choices"][0]["message"]["content"])
             try:
-                parsed_json = json.loads(response_content);
-                return response_content
+                analysis = json_loads(response_content)
             except json.JSONDecodeError as json_e:
-                print(f"Error: Could not decode LLM JSON output: {json_e}");
-                print(f"LLM Raw Output: {response_content}")
-                error_json = json.dumps(
-                    {"error": f"LLM output failed JSON parsing: {json_e}", "raw_output": response_content}, indent=2);
-                return error_json
+                logger.error("Could not decode meeting analysis JSON: {}", json_e);
+                logger.info("LLM Raw Output: {}", response_content)
+                return None
+            if not isinstance(analysis, dict) or not isinstance(analysis.get("summary"), str):
+                logger.error("Meeting analysis JSON is missing the summary field: {}", response_content)
+                return None
+            for key in NOTES_KEYS:
+                if not isinstance(analysis.get(key), list):
+                    analysis[key] = []
+            cache_put(cache_id, analysis)
+            return analysis
         except requests.exceptions.Timeout:
-            print("Error: JSON extraction request timed out."); return None
+            logger.error("Meeting analysis request timed out."); return None
         except requests.exceptions.RequestException as e:
-            print(f"Error during JSON extraction request: {e}")
+            logger.error("Error during meeting analysis request: {}", e)
             try:
-                if response is not None and hasattr(response, 'text'): print(f"Response content: {response.text}")
+                if response is not None and hasattr(response, 'text'): logger.info("Response content: {}", response.text)
             except Exception:
                 pass
             return None
@@ -253,37 +1042,209 @@ class LLMJsonExtractor:
                     response_info = response.text
             except Exception:
                 pass
-            print(f"Error: Unexpected LLM API response format ({e}). Response: {response_info}");
+            logger.error("Unexpected LLM API response format ({}). Response: {}", e, response_info);
             return None
         except Exception as e:
-            print(f"An unexpected error occurred during JSON extraction: {e}"); return None
+            logger.error("An unexpected error occurred during meeting analysis: {}", e); return None
+
+    def analyze_mapreduce(self, chunk_texts):
+        """Analyzes groups of chunk transcripts in parallel with RECAP_MODEL, then merges the partial summaries
+        with one gpt-4o call. Returns the same dict as analyze(), or None on failure."""
+        parts = self._group_chunks(chunk_texts)
+        if len(parts) < 2:
+            return self.analyze(" ".join(parts))
+        logger.info("Meeting analysis: map step over {} transcript parts.", len(parts))
+        with self._part_lock:
+            futures = [self._part_futures.pop(part, None) or self._part_pool.submit(self.analyze, part, RECAP_MODEL)
+                       for part in parts]
+            # Anything left over belongs to a transcript that changed; cancel it so it isn't still paid for
+            for stale_future in self._part_futures.values():
+                stale_future.cancel()
+            self._part_futures.clear()
+        partials = [future.result() for future in futures]
+        if any(partial is None for partial in partials):
+            logger.error("Meeting analysis map step failed for at least one part.")
+            return None
+        merged = {key: [] for key in NOTES_KEYS}
+        for partial in partials:
+            for key in NOTES_KEYS:
+                merged[key].extend(item for item in partial[key] if item not in merged[key])
+        summary = self._merge_summaries([partial["summary"] for partial in partials])
+        if summary is None:
+            return None
+        merged["summary"] = summary
+        return merged
+
+    def prefetch_part(self, part):
+        """Starts the map-step analysis of a finished transcript part in the background for analyze_mapreduce."""
+        with self._part_lock:
+            if part not in self._part_futures:
+                self._part_futures[part] = self._part_pool.submit(self.analyze, part, RECAP_MODEL)
+
+    def shutdown(self):
+        """Cancels queued map-step analyses without waiting, so closing the app isn't held up by them."""
+        self._part_pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _group_chunks(chunk_texts):
+        """Joins consecutive chunk transcripts into parts of roughly MAPREDUCE_PART_CHARS."""
+        parts = []
+        current = []
+        current_len = 0
+        for text in chunk_texts:
+            if not text or text.isspace() or text.startswith("[ERROR:"):
+                continue
+            if current and current_len + len(text) > MAPREDUCE_PART_CHARS:
+                parts.append(" ".join(current))
+                current = []
+                current_len = 0
+            current.append(text)
+            current_len += len(text) + 1
+        if current:
+            parts.append(" ".join(current))
+        return parts
+
+    def _merge_summaries(self, partial_summaries):
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        prompt = _MERGE_SUMMARIES_PROMPT_TMPL.format(partial_summaries="\n\n".join(
+            f"--- Part {i + 1} ---\n{summary}" for i, summary in enumerate(partial_summaries)))
+        data = {"model": "gpt-4o", "messages": [{"role": "system",
+                                                 "content": "You are a helpful assistant skilled at analyzing meeting transcripts and creating concise bullet-point summaries."},
+                                                {"role": "user", "content": prompt}], "temperature": 0.3}
+        cache_id = cache_key(self.api_url, data)
+        cached = cache_get(cache_id)
+        if cached is not None: logger.info("Summary merge cache hit."); return cached
+        try:
+            response = _SESSION.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS);
+            response.raise_for_status()
+            summary = json_loads(response.content)["choices"][0]["message"]["content"].strip()
+            cache_put(cache_id, summary)
+            return summary
+        except requests.exceptions.RequestException as e:
+            logger.error("Error during summary merge request: {}", e); return None
+        except (ValueError, KeyError, IndexError) as e:
+            logger.error("Unexpected LLM API response format during summary merge ({}).", e); return None
 
 
 # --- Worker Runnables ---
 class TranscriptionWorker(QRunnable):
-    """Worker thread for running transcription on a single audio chunk file"""
+    """Worker thread for running transcription on a single in-memory audio chunk"""
 
-    def __init__(self, audio_file_path, api_key):
+    def __init__(self, chunk_path, audio_bytes, transcriber, semaphore=None, prompt=None, pcm_digest=None):
         super().__init__()
-        self.audio_file_path = audio_file_path
-        self.api_key = api_key
+        self.chunk_path = chunk_path  # Chunk name; identifies the chunk, nothing is read from disk
+        self.audio_bytes = audio_bytes
+        self.pcm_digest = pcm_digest  # audio_digest of the chunk's samples, for the per-chunk transcript cache
+        self.transcriber = transcriber
+        self.prompt = prompt
+        self.semaphore = semaphore  # Bounds concurrent Whisper requests across all chunk workers
         self.signals = WorkerSignals()
 
     def run(self):
+        file_name = os.path.basename(self.chunk_path)
         try:
-            if not self.api_key:
-                self.signals.error.emit(
-                    f"Transcription failed for {os.path.basename(self.audio_file_path)}: API key missing in worker.")
+            if not self.transcriber.api_key:
+                self.signals.error.emit(f"Transcription failed for {file_name}: API key missing in worker.")
             else:
-                transcriber = WhisperTranscriber(self.api_key)
-                transcript = transcriber.transcribe(self.audio_file_path)
+                transcript = None
+                if self.pcm_digest:
+                    transcript = self.transcriber.cached_chunk_transcript(self.pcm_digest)
+                if transcript is None:
+                    if self.semaphore is not None:
+                        with self.semaphore:
+                            transcript = self.transcriber.transcribe(self.audio_bytes, file_name, self.prompt)
+                    else:
+                        transcript = self.transcriber.transcribe(self.audio_bytes, file_name, self.prompt)
+                    if transcript is not None and self.pcm_digest:
+                        self.transcriber.store_chunk_transcript(self.pcm_digest, transcript)
                 if transcript is not None:
-                    self.signals.transcription_result.emit(transcript, self.audio_file_path)
+                    self.signals.transcription_result.emit(transcript, self.chunk_path)
                 else:
-                    self.signals.error.emit(f"Transcription failed for {os.path.basename(self.audio_file_path)}")
+                    self.signals.error.emit(f"Transcription failed for {file_name}")
         except Exception as e:
-            self.signals.error.emit(
-                f"Unexpected error in TranscriptionWorker for {os.path.basename(self.audio_file_path)}: {e}")
+            self.signals.error.emit(f"Unexpected error in TranscriptionWorker for {file_name}: {e}")
+        finally:
+            self.signals.finished.emit()
+
+
+class BatchTranscriptionWorker(QRunnable):
+    """Worker thread transcribing several adjacent chunks of a saved recording with a single Whisper request"""
+
+    def __init__(self, chunk_paths, full_audio_path, first_frame, frames_per_chunk, transcriber, semaphore=None):
+        super().__init__()
+        self.chunk_paths = chunk_paths  # Chunk names, in order, for the frames starting at first_frame
+        self.full_audio_path = full_audio_path
+        self.first_frame = first_frame
+        self.frames_per_chunk = frames_per_chunk
+        self.transcriber = transcriber
+        self.semaphore = semaphore
+        self.signals = WorkerSignals()
+
+    def _transcribe(self, fn, *args):
+        if self.semaphore is not None:
+            with self.semaphore:
+                return fn(*args)
+        return fn(*args)
+
+    def run(self):
+        try:
+            if not self.transcriber.api_key:
+                for chunk_path in self.chunk_paths:
+                    self.signals.transcription_error.emit("API key missing in worker.", chunk_path)
+                return
+            pcm, sample_width = read_wav_frames(self.full_audio_path, self.first_frame,
+                                                self.frames_per_chunk * len(self.chunk_paths))
+            chunk_pcms = split_pcm_chunks(pcm, self.frames_per_chunk * CHANNELS, len(self.chunk_paths))
+            # Silent chunks are never uploaded; they resolve to an empty transcript so ordering is kept
+            voiced = []
+            for chunk_path, chunk_pcm in zip(self.chunk_paths, chunk_pcms):
+                if chunk_rms(chunk_pcm) >= SILENCE_RMS_THRESHOLD:
+                    voiced.append((chunk_path, chunk_pcm))
+                else:
+                    logger.info("Chunk {} is silent. Skipping transcription.", os.path.basename(chunk_path))
+                    self.signals.transcription_result.emit("", chunk_path)
+            transcriber = self.transcriber
+            # Chunks transcribed before (live during recording, or in an earlier run) are not uploaded again
+            digests = {}
+            uncached = []
+            for chunk_path, chunk_pcm in voiced:
+                digests[chunk_path] = audio_digest(chunk_pcm)
+                cached = transcriber.cached_chunk_transcript(digests[chunk_path])
+                if cached is not None:
+                    logger.info("Transcription cache hit for {}", os.path.basename(chunk_path))
+                    self.signals.transcription_result.emit(cached, chunk_path)
+                else:
+                    uncached.append((chunk_path, chunk_pcm))
+            voiced = uncached
+            if not voiced:
+                return
+            voiced_paths = [chunk_path for chunk_path, _ in voiced]
+            voiced_pcms = [chunk_pcm for _, chunk_pcm in voiced]
+            transcripts = None
+            if len(voiced) > 1:
+                chunk_ends = np.cumsum([chunk_pcm.size for chunk_pcm in voiced_pcms])
+                boundaries = (chunk_ends / (CHANNELS * RATE)).tolist()
+                batch_pcm = pcm if len(voiced) == len(self.chunk_paths) else np.concatenate(voiced_pcms)
+                transcripts = self._transcribe(transcriber.transcribe_batch, encode_upload_audio(batch_pcm, sample_width),
+                                               boundaries)
+                if transcripts is None:
+                    # Fall back to one request per chunk so a single bad chunk can't sink the whole batch
+                    logger.warning("Batch transcription failed; retrying {} chunks individually.", len(voiced))
+            if transcripts is None:
+                transcripts = [
+                    self._transcribe(transcriber.transcribe, encode_upload_audio(chunk_pcm, sample_width),
+                                     os.path.basename(chunk_path))
+                    for chunk_path, chunk_pcm in voiced]
+            for chunk_path, transcript in zip(voiced_paths, transcripts):
+                if transcript is not None:
+                    transcriber.store_chunk_transcript(digests[chunk_path], transcript)
+                    self.signals.transcription_result.emit(transcript, chunk_path)
+                else:
+                    self.signals.transcription_error.emit(
+                        f"Transcription failed for {os.path.basename(chunk_path)}", chunk_path)
+        except Exception as e:
+            for chunk_path in self.chunk_paths:
+                self.signals.transcription_error.emit(f"Unexpected error in BatchTranscriptionWorker: {e}", chunk_path)
         finally:
             self.signals.finished.emit()
 
@@ -301,30 +1262,41 @@ class LLMRecapWorker(QRunnable):
         self.api_url = LLM_API_URL
 
     def run(self):
-        print("DEBUG: LLMRecapWorker started.")
+        logger.debug("LLMRecapWorker started.")
         try:
             if not self.api_key:
                 self.signals.error.emit("LLM Recap failed: API key missing in worker.")
                 return
 
             if not self.aggregated_bullets_text or self.aggregated_bullets_text.isspace():
-                print("DEBUG: LLMRecapWorker: Input text is empty, returning empty recap.")
+                logger.debug("LLMRecapWorker: Input text is empty, returning empty recap.")
                 self.signals.recap_result.emit("(No specific items were provided for narrative summarization.)")
                 return
 
+            state_key = f"{self.project_name}|{self.week_str}"
+            input_hash = hashlib.sha256(f"{RECAP_MODEL}\n{self.aggregated_bullets_text}".encode("utf-8")).hexdigest()
+            bullets = self._bullet_lines(self.aggregated_bullets_text)
+            previous = load_recap_state(state_key)
+            if previous and previous.get("input_hash") == input_hash and previous.get("output"):
+                logger.debug("LLMRecapWorker: Inputs unchanged since last recap, emitting stored recap.")
+                self.signals.recap_result.emit(previous["output"])
+                return
+
             headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-            prompt = (
-                f"You are an assistant summarizing weekly project activity for an executive audience. "
-                f"Review the following aggregated bullet points for project '{self.project_name}' during the week '{self.week_str}'.\n"
-                f"Rewrite these points into a concise, professional, executive-friendly narrative summary (1-3 short paragraphs).\n"
-                f"Focus on key accomplishments, decisions, and any critical risks or open questions that need visibility.\n"
-                f"Avoid jargon where possible. Maintain a positive but realistic tone.\n\n"
-                f"--- Aggregated Notes ---\n"
-                f"{self.aggregated_bullets_text}\n\n"
-                f"--- Executive Narrative Summary ---"
-            )
+            previous_bullets = set(previous.get("bullets") or []) if previous and previous.get("output") else set()
+            delta_bullets = [b for b in bullets if b not in previous_bullets]
+            if previous_bullets and delta_bullets and previous_bullets.issubset(bullets):
+                # Only new items were added for this week: fold them into the existing narrative
+                delta_bullets_text = "\n".join(delta_bullets)
+                logger.debug("LLMRecapWorker: Updating stored recap with new bullets only.")
+                prompt = _RECAP_UPDATE_PROMPT_TMPL.format(project_name=self.project_name, week_str=self.week_str,
+                                                          previous_recap=previous["output"],
+                                                          delta_bullets_text=delta_bullets_text)
+            else:
+                prompt = _RECAP_PROMPT_TMPL.format(project_name=self.project_name, week_str=self.week_str,
+                                                   aggregated_bullets_text=self.aggregated_bullets_text)
             data = {
-                "model": "gpt-4o",
+                "model": RECAP_MODEL,
                 "messages": [
                     {"role": "system",
                      "content": "You generate concise, executive-friendly narrative summaries of weekly project activities based on provided bullet points."},
@@ -333,67 +1305,69 @@ class LLMRecapWorker(QRunnable):
                 "temperature": 0.6,
                 "max_tokens": 400
             }
-            response = None
-            response_data = None
-            print("DEBUG: LLMRecapWorker: Sending request to LLM...")
-            response = requests.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS)
-            response.raise_for_status()
-            response_data = response.json()
-            print("DEBUG: LLMRecapWorker: Received response from LLM.")
-            recap_text = response_data["choices"][0]["message"]["content"].strip()
+            key = cache_key(self.api_url, data)
+            recap_text = cache_get(key)
+            if recap_text is not None:
+                logger.debug("LLMRecapWorker: Cache hit, emitting cached recap.")
+                save_recap_state(state_key, {"input_hash": input_hash, "bullets": bullets, "output": recap_text})
+                self.signals.recap_result.emit(recap_text)
+                return
+            logger.debug("LLMRecapWorker: Sending request to LLM...")
+            recap_text = stream_chat_completion(self.api_url, headers, data,
+                                                 self.signals.recap_partial.emit).strip()
+            cache_put(key, recap_text)
+            save_recap_state(state_key, {"input_hash": input_hash, "bullets": bullets, "output": recap_text})
+            logger.debug("LLMRecapWorker: Received response from LLM.")
             self.signals.recap_result.emit(recap_text)
-            print("DEBUG: LLMRecapWorker: Emitted recap result.")
+            logger.debug("LLMRecapWorker: Emitted recap result.")
         except requests.exceptions.Timeout:
             err_msg = "LLM Recap failed: Request timed out."
-            print(f"ERROR: {err_msg}")
+            logger.error(err_msg)
             self.signals.error.emit(err_msg)
         except requests.exceptions.RequestException as e:
             error_detail = f"LLM Recap failed: Network/API error: {e}"
-            try:
-                if response is not None and hasattr(response, 'text'):
-                    error_detail += f" - Response Status: {response.status_code}, Body: {response.text[:500]}..."
-            except Exception as detail_e:
-                print(f"DEBUG: Error getting exception details: {detail_e}")
-            print(f"ERROR: {error_detail}")
-            self.signals.error.emit(error_detail)
-        except (KeyError, IndexError) as e:
-            error_detail = f"LLM Recap failed: Unexpected API response format ({e})."
-            response_info = "N/A"
-            try:
-                if response_data is not None:
-                    response_info = str(response_data)[:500]
-                elif response is not None and hasattr(response, 'text'):
-                    response_info = response.text[:500]
-            except Exception as detail_e:
-                print(f"DEBUG: Error getting exception details: {detail_e}")
-            error_detail += f" Response: {response_info}..."
-            print(f"ERROR: {error_detail}")
+            if e.response is not None:
+                error_detail += f" - Response Status: {e.response.status_code}, Body: {e.response.text[:500]}..."
+            logger.error(error_detail)
             self.signals.error.emit(error_detail)
         except Exception as e:
             err_msg = f"LLM Recap failed: An unexpected error occurred in worker: {type(e).__name__} - {e}"
-            print(f"ERROR: {err_msg}")
+            logger.error(err_msg)
             self.signals.error.emit(err_msg)
         finally:
-            print("DEBUG: LLMRecapWorker finished.")
+            logger.debug("LLMRecapWorker finished.")
             self.signals.finished.emit()
 
+    @staticmethod
+    def _bullet_lines(aggregated_bullets_text):
+        """Bullet items keyed by their section heading, e.g. 'Decisions: *   Ship v2'."""
+        lines = []
+        section = ""
+        for line in aggregated_bullets_text.splitlines():
+            line = line.strip()
+            if line.startswith("#"):
+                section = line.lstrip("#").strip()
+            elif line:
+                lines.append(f"{section} {line}".strip())
+        return lines
+
 
 class SummarizationWorker(QRunnable):
     """Worker thread for running final summarization"""
 
-    def __init__(self, text_to_summarize, api_key):
+    def __init__(self, text_to_summarize, summarizer):
         super().__init__();
         self.text_to_summarize = text_to_summarize;
-        self.api_key = api_key;
+        self.summarizer = summarizer;
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            if not self.api_key:
+            if not self.summarizer.api_key:
                 self.signals.error.emit("Summarization failed: API key missing in worker.")
             else:
-                summarizer = LLMSummarizer(self.api_key);
-                summary = summarizer.summarize(self.text_to_summarize)
+                summary = self.summarizer.summarize(self.text_to_summarize,
+                                                    self.signals.summarization_partial.emit)
                 if summary is not None:
                     self.signals.summarization_result.emit(summary)
                 else:
@@ -505,19 +1479,18 @@ class SummarizationWorker(QRunnable):
 class JsonExtractionWorker(QRunnable):
     """Worker thread for running JSON note extraction"""
 
-    def __init__(self, transcript_text, api_key):
+    def __init__(self, transcript_text, json_extractor):
         super().__init__()
         self.transcript_text = transcript_text
-        self.api_key = api_key
+        self.json_extractor = json_extractor
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            if not self.api_key:
+            if not self.json_extractor.api_key:
                 self.signals.error.emit("JSON extraction failed: API key missing in worker.")
             else:
-                extractor = LLMJsonExtractor(self.api_key)
-                json_string = extractor.extract_notes(self.transcript_text)
+                json_string = self.json_extractor.extract_notes(self.transcript_text)
                 if json_string is not None:
                     self.signals.json_notes_result.emit(json_string)
                 else:
@@ -528,17 +1501,205 @@ class JsonExtractionWorker(QRunnable):
             self.signals.finished.emit()
 
 
+class StandupReportWorker(QRunnable):
+    """Worker thread loading the notes of a project's recent meetings and assembling the stand-up report"""
+
+    def __init__(self, history, target_project, hours_back):
+        super().__init__()
+        self.history = history
+        self.target_project = target_project
+        self.hours_back = hours_back
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.signals.result.emit(self._build_report())  # (markdown, status message)
+        except Exception as e:
+            self.signals.error.emit(f"Error generating stand-up report: {e}")
+        finally:
+            self.signals.finished.emit()
+
+    def _build_report(self):
+        target_project = self.target_project
+        hours_back = self.hours_back
+        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        relevant_meetings = []
+        notes_mtimes = []
+        # The history index hands back this project's meetings since the cutoff, already in date order
+        for meeting in self.history.meetings_in_range(target_project, cutoff_time, datetime.max):
+            notes_mtime = meeting.notes_mtime()
+            if notes_mtime is not None:
+                relevant_meetings.append(meeting)
+                notes_mtimes.append(notes_mtime)
+        if not relevant_meetings:
+            report_md = f"## Stand-up Notes: {target_project} (Last {hours_back} Hours)\n\n"
+            report_md += f"(No relevant meeting notes found with existing JSON files for this project in the specified time frame)"
+            return report_md, f"Report generated: No relevant notes found for {target_project}."
+        report_parts = [f"## Stand-up Notes: {target_project} (Last {hours_back} Hours)\n\n"]
+        meetings_processed_count = 0
+        notes_paths = [meeting.resolved_notes_path for meeting in relevant_meetings]
+        loaded_notes = load_notes_files(notes_paths, notes_mtimes)  # All files are read and parsed concurrently first
+        for meeting, full_notes_path, (notes_data, load_error) in zip(relevant_meetings, notes_paths, loaded_notes):
+            meeting_name = meeting.name
+            meeting_project = meeting.project_name
+            meeting_date = meeting.date
+            try:
+                if load_error is not None:
+                    raise load_error
+                if notes_data is None:
+                    logger.warning("Notes file is empty: {}", full_notes_path)
+                    notes_data = {}
+                elif isinstance(notes_data, dict) and "error_parsing_raw" in notes_data:
+                    logger.error("Failed parsing raw_output for {}. Skipping formatting.", meeting_name)
+                    report_parts.append(f"### {meeting_name} ({meeting_project} - {meeting_date})\n")
+                    report_parts.append(f"  *   **Error:** Notes file contained an error structure and the raw data inside could not be parsed.\n\n---\n\n")
+                    continue
+                meeting_md_snippet = format_meeting_notes_md(meeting, notes_data)
+                if meeting_md_snippet:
+                    report_parts.append(meeting_md_snippet + "\n---\n\n")
+                    meetings_processed_count += 1
+            except json.JSONDecodeError as outer_jde:
+                logger.error("Could not decode initial JSON from file: {}. Error: {}", full_notes_path, outer_jde)
+                report_parts.append(f"### {meeting_name} ({meeting_project} - {meeting_date})\n")
+                report_parts.append(f"  *   **Error:** Could not read notes file (Invalid JSON): {outer_jde}.\n\n---\n\n")
+            except FileNotFoundError:
+                logger.error("Notes file not found during formatting: {}", full_notes_path)
+                report_parts.append(f"### {meeting_name} ({meeting_project} - {meeting_date})\n")
+                report_parts.append("  *   **Error:** Notes file not found at specified path.\n\n---\n\n")
+            except IOError as ioe:
+                logger.error("Could not open or read notes file {} for report: {}", full_notes_path, ioe)
+                report_parts.append(f"### {meeting_name} ({meeting_project} - {meeting_date})\n")
+                report_parts.append(f"  *   **Error:** Could not read notes file (IO Error): {ioe}.\n\n---\n\n")
+            except Exception as e:
+                logger.error("Unexpected error processing notes file {} or formatting meeting {}: {} - {}", full_notes_path, meeting_name, type(e).__name__, e)
+                report_parts.append(f"### {meeting_name} ({meeting_project} - {meeting_date})\n")
+                report_parts.append(f"  *   **Error:** Could not process notes file ({type(e).__name__}: {e}).\n\n---\n\n")
+        final_report_md = "".join(report_parts)
+        if meetings_processed_count == 0:
+            if relevant_meetings:
+                if "Error:" not in final_report_md[-500:]:
+                    final_report_md += "(No extracted Decisions, Action Items, Risks, or Questions found or processed successfully in relevant meetings)\n"
+        return final_report_md, f"Stand-up notes report generated for project '{target_project}'."
+
+
+class HistoryLoadWorker(QRunnable):
+    """Worker thread reading the meeting history file so startup doesn't block on it"""
+
+    def __init__(self, history):
+        super().__init__()
+        self.history = history
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.history.load_history()
+        except Exception as e:
+            self.signals.error.emit(f"Error loading meeting history: {e}")
+        try:
+            removed = prune_cache()
+            if removed:
+                logger.info("Pruned {} old response cache entries.", removed)
+        except Exception as e:
+            logger.warning("Response cache pruning failed: {}", e)
+        finally:
+            self.signals.finished.emit()
+
+
+class MeetingFilesLoadWorker(QRunnable):
+    """Worker thread reading a history meeting's transcript and rendering its summary for the details pane.
+    If given the project's wiki, it then warms the wiki section cache so Suggest Updates starts without file I/O."""
+
+    def __init__(self, meeting, wiki_file_path=None, wiki_sections=()):
+        super().__init__()
+        self.meeting = meeting
+        self.wiki_file_path = wiki_file_path
+        self.wiki_sections = wiki_sections
+        self.signals = WorkerSignals()
+
+    def run(self):
+        meeting = self.meeting
+        errors = []
+        try:
+            if meeting.transcript_path and os.path.exists(meeting.transcript_path):
+                with open(meeting.transcript_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                    transcript_text = f.read(HISTORY_PREVIEW_MAX_CHARS)
+                    if f.read(1):
+                        transcript_text += "\n\n…(truncated, open the transcript file to view the full text)"
+            else:
+                transcript_text = "Transcript file not found."
+        except Exception as e:
+            errors.append(f"Error loading transcript file {meeting.transcript_path}: {e}")
+            transcript_text = "Error loading transcript."
+        summary_html = None
+        summary_text = ""
+        try:
+            if meeting.summary_path and os.path.exists(meeting.summary_path):
+                summary_html = render_markdown_file(meeting.summary_path)
+            else:
+                summary_text = "Summary file not found."
+        except Exception as e:
+            errors.append(f"Error loading summary file {meeting.summary_path}: {e}")
+            summary_text = "Error loading summary."
+        try:
+            self.signals.result.emit((meeting.meeting_id, transcript_text, summary_html, summary_text, errors))
+            self._prefetch_wiki_sections()
+        finally:
+            self.signals.finished.emit()
+
+    def _prefetch_wiki_sections(self):
+        if not self.wiki_file_path:
+            return
+        try:
+            file_version = _wiki_file_version(self.wiki_file_path)
+            for section_title in self.wiki_sections:
+                _wiki_section_cached(self.wiki_file_path, file_version, section_title)
+        except Exception as e:  # No wiki yet, or unreadable: the click handler reports it if the user gets there
+            logger.debug("Wiki prefetch skipped for {}: {}", self.wiki_file_path, e)
+
+
+class MeetingAnalysisWorker(QRunnable):
+    """Worker thread producing both the JSON notes and the summary from one LLM call"""
+
+    def __init__(self, transcript_text, analyzer, chunk_texts=None):
+        super().__init__()
+        self.transcript_text = transcript_text
+        self.analyzer = analyzer
+        self.chunk_texts = chunk_texts  # Per-chunk transcripts, used to split long meetings for map-reduce
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            if not self.analyzer.api_key:
+                self.signals.error.emit("Meeting analysis failed: API key missing in worker.")
+            else:
+                if self.chunk_texts and len(self.transcript_text) >= MAPREDUCE_MIN_CHARS:
+                    analysis = self.analyzer.analyze_mapreduce(self.chunk_texts)
+                else:
+                    analysis = self.analyzer.analyze(self.transcript_text)
+                if analysis is not None:
+                    notes = {key: analysis[key] for key in NOTES_KEYS}
+                    self.signals.json_notes_result.emit(json_dumps(notes, indent=True))
+                    self.signals.summarization_result.emit(analysis["summary"].strip())
+                else:
+                    self.signals.error.emit("Meeting analysis failed.")
+        except Exception as e:
+            self.signals.error.emit(f"Error in meeting analysis worker: {e}")
+        finally:
+            self.signals.finished.emit()
+
+
 class WikiUpdateSuggestionWorker(QRunnable):
     """
     Worker thread to get AI suggestions for updating a wiki section
     based on meeting content.
     """
 
-    def __init__(self, current_section_content, meeting_info_text,
+    def __init__(self, current_section_content, meeting_info_path,
                  target_section_title, project_name, api_key):
         super().__init__()
         self.current_section_content = current_section_content
-        self.meeting_info_text = meeting_info_text
+        self.meeting_info_path = meeting_info_path  # Transcript or notes file; read here rather than on the GUI thread
+        self.meeting_info_text = ""
         self.target_section_title = target_section_title
         self.project_name = project_name
         self.api_key = api_key
@@ -550,53 +1711,31 @@ class WikiUpdateSuggestionWorker(QRunnable):
             if not self.api_key:
                 self.signals.error.emit("Wiki Suggestion failed: API key missing.");
                 return
-            if not self.meeting_info_text:
-                self.signals.error.emit("Wiki Suggestion failed: Meeting information is empty.");
+            try:
+                with open(self.meeting_info_path, 'r', encoding='utf-8') as f_info:
+                    self.meeting_info_text = f_info.read()
+            except Exception as e_read_info:
+                self.signals.error.emit(f"Error reading meeting info from {self.meeting_info_path}: {e_read_info}");
+                return
+            if not self.meeting_info_text.strip():
+                self.signals.error.emit("Wiki Suggestion failed: Meeting information (transcript/notes) is empty.");
                 return
             if not self.target_section_title:
                 self.signals.error.emit("Wiki Suggestion failed: Target section title is missing.");
                 return
 
             headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-            specific_instructions = ""
-            output_instructions = (
-                f"Output ONLY the complete, revised text for the '{self.target_section_title}' section. "
-                f"Do not add any conversational preamble, explanation, or the markdown section header itself (like '## {self.target_section_title}'). "
-                f"Just provide the content that should go *under* that header."
-            )
+            prompt_fields = {"project_name": self.project_name, "target_section_title": self.target_section_title}
             if self.target_section_title.lower() == "daily log":
-                specific_instructions = (
-                    f"Based ONLY on the new information from the recent meeting (details below), "
-                    f"generate a CONCISE new entry for the 'Daily Log' for project '{self.project_name}'. "
-                    f"The entry should summarize key activities, decisions, and next steps from this specific meeting. "
-                    f"Format the entry as a few bullet points. "
-                    f"If the meeting has no new log-worthy updates, output ONLY the exact phrase 'No new log entries from this meeting.'"
-                )
-                output_instructions = (
-                    f"Output ONLY the bullet points for the new log entry. "
-                    f"If no new log entries, output ONLY the exact phrase 'No new log entries from this meeting.'"
-                )
+                specific_instructions = _WIKI_DAILY_LOG_INSTRUCTIONS_TMPL.format_map(prompt_fields)
+                output_instructions = _WIKI_DAILY_LOG_OUTPUT
             else:
-                specific_instructions = (
-                    f"You are updating the '{self.target_section_title}' section of the project wiki for '{self.project_name}'.\n"
-                    f"Based ONLY on the new information from the recent meeting (details below), suggest a revised version of the ENTIRE '{self.target_section_title}' section.\n"
-                    f"If the meeting introduced new relevant points, add them. "
-                    f"If the meeting clarified or changed existing points, reflect those changes. "
-                    f"If the meeting made some existing points obsolete or less relevant, remove or update them accordingly. "
-                    f"The goal is to have an up-to-date section based on the latest meeting.\n"
-                    f"If no changes to the '{self.target_section_title}' section are warranted based on this meeting, output the original 'Current Section Content' unchanged."
-                )
-            prompt = (
-                f"You are an AI assistant helping to maintain a project wiki.\n"
-                f"Project: {self.project_name}\n"
-                f"Target Section to Update: {self.target_section_title}\n\n"
-                f"Current '{self.target_section_title}' Section Content (if any - for 'Daily Log' this is less relevant, focus on new entry):\n"
-                f"```\n{self.current_section_content if self.current_section_content else 'This section is currently empty or new.'}\n```\n\n"
-                f"Information from Recent Meeting:\n"
-                f"```\n{self.meeting_info_text}\n```\n\n"
-                f"Instructions:\n{specific_instructions}\n\n"
-                f"{output_instructions}"
-            )
+                specific_instructions = _WIKI_SECTION_INSTRUCTIONS_TMPL.format_map(prompt_fields)
+                output_instructions = _WIKI_SECTION_OUTPUT_TMPL.format_map(prompt_fields)
+            prompt = _WIKI_PROMPT_TMPL.format(
+                current_section_content=self.current_section_content if self.current_section_content else 'This section is currently empty or new.',
+                meeting_info_text=self.meeting_info_text, specific_instructions=specific_instructions,
+                output_instructions=output_instructions, **prompt_fields)
             data = {
                 "model": "gpt-4o",
                 "messages": [
@@ -609,9 +1748,9 @@ class WikiUpdateSuggestionWorker(QRunnable):
             response = None
             response_data = None
             try:
-                response = requests.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS)
+                response = _SESSION.post(self.api_url, headers=headers, json=data, timeout=API_TIMEOUTS)
                 response.raise_for_status()
-                response_data = response.json()
+                response_data = json_loads(response.content)
                 suggested_text = response_data["choices"][0]["message"]["content"].strip()
                 self.signals.wiki_suggestion_result.emit(suggested_text, self.target_section_title)
             except requests.exceptions.Timeout:
@@ -642,112 +1781,382 @@ class WikiUpdateSuggestionWorker(QRunnable):
             self.signals.finished.emit()
 
 
+class WikiWriteWorker(QRunnable):
+    """
+    Worker thread to apply an accepted suggestion to the project wiki file,
+    so reading and rewriting a large wiki doesn't stall the GUI.
+    """
+
+    def __init__(self, wiki_file_path, section_title, new_section_content):
+        super().__init__()
+        self.wiki_file_path = wiki_file_path
+        self.section_title = section_title
+        self.new_section_content = new_section_content
+        self.signals = WorkerSignals()
+
+    # The writers below report through these, which hand the messages to the GUI thread
+    def update_status(self, message):
+        self.signals.wiki_write_status.emit(message)
+
+    def display_error(self, message):
+        self.signals.error.emit(message)
+
+    def run(self):
+        try:
+            if self.section_title.lower() == "daily log":
+                success = self._update_daily_log_section(self.wiki_file_path, self.new_section_content)
+            else:
+                success = self._replace_wiki_section(self.wiki_file_path, self.section_title, self.new_section_content)
+            self.signals.result.emit((self.section_title, success))
+        except Exception as e:
+            self.signals.error.emit(f"Error in wiki write worker: {e}")
+            self.signals.result.emit((self.section_title, False))
+        finally:
+            self.signals.finished.emit()
+
+    def _replace_wiki_section(self, wiki_file_path, section_title, new_section_content):
+        if new_section_content and not new_section_content.endswith('\n'):
+            new_section_content += '\n'
+        if not new_section_content:
+            new_section_content = '\n'
+        title_lower = section_title.lower()
+        try:
+            wiki_version = _wiki_file_version(wiki_file_path)
+        except FileNotFoundError:
+            wiki_version = None
+        if wiki_version is None:
+            try:
+                with open(wiki_file_path, 'w', encoding='utf-8') as f:
+                    f.write(f"## {section_title}\n{new_section_content}")
+                _clear_wiki_caches()
+                self.update_status(f"Created new wiki file with section: {os.path.basename(wiki_file_path)}")
+                return True
+            except Exception as e:
+                self.display_error(f"Error creating new wiki file {os.path.basename(wiki_file_path)}: {e}")
+                return False
+        try:
+            unchanged = _wiki_section_unchanged(_wiki_lines_cached(wiki_file_path, wiki_version),
+                                                section_title, new_section_content)
+        except Exception:
+            unchanged = False  # The rewrite below reports the read error
+        if unchanged:
+            self.update_status(f"Wiki section '{section_title}' unchanged; {os.path.basename(wiki_file_path)} not rewritten.")
+            return True
+        # Single streaming pass into a temp file that replaces the wiki at the end; the section keeps its heading level
+        tmp_file = f"{wiki_file_path}.tmp"
+        in_section_to_replace = False
+        section_replaced_or_found = False
+        last_written = ""
+        try:
+            with open(wiki_file_path, 'r', encoding='utf-8') as fin, open(tmp_file, 'w', encoding='utf-8') as fout:
+                for line in fin:
+                    header = _parse_header(line)
+                    if _is_titled(header, title_lower):
+                        if not section_replaced_or_found:
+                            last_written = f"{'#' * header[0]} {section_title}\n{new_section_content}"
+                            fout.write(last_written)
+                            section_replaced_or_found = True
+                            in_section_to_replace = True
+                        continue
+                    if in_section_to_replace:
+                        if not _is_heading(header):
+                            continue
+                        in_section_to_replace = False
+                    fout.write(line)
+                    last_written = line
+                if not section_replaced_or_found:
+                    if last_written.strip() != "":
+                        if not last_written.endswith('\n'): fout.write('\n')
+                        fout.write('\n')
+                    fout.write(f"## {section_title}\n{new_section_content}")
+                # On disk before the rename, so a crash can't swap in a wiki the OS hadn't finished writing
+                fout.flush()
+                os.fsync(fout.fileno())
+            os.replace(tmp_file, wiki_file_path)
+            _clear_wiki_caches()
+        except Exception as e:
+            self.display_error(f"Error writing updated wiki file {os.path.basename(wiki_file_path)}: {e}")
+            return False
+        if not section_replaced_or_found:
+            self.update_status(f"Section '{section_title}' appended to wiki.")
+        self.update_status(f"Wiki section '{section_title}' updated in {os.path.basename(wiki_file_path)}")
+        return True
+
+    def _update_daily_log_section(self, wiki_file_path, new_log_entry_text, entry_date_str=None):
+        entry_text = new_log_entry_text.strip()
+        if not entry_text or entry_text.lower() == "no new log entries from this meeting.":
+            self.update_status("Daily log update skipped: New entry text is empty or indicates no new entries.")
+            return True
+        if entry_date_str is None:
+            entry_date_str = datetime.now().strftime("%Y-%m-%d")
+        daily_log_main_header = "## Daily Log"
+        date_subheader = f"### {entry_date_str}"
+        formatted_new_entry_lines = [
+            line if stripped_line.startswith(("* ", "- ", "### ")) else f"- {stripped_line}"
+            for line, stripped_line in ((line, line.strip()) for line in entry_text.split('\n'))
+            if stripped_line
+        ]
+        new_log_entry_block = "\n".join(formatted_new_entry_lines)
+        if not new_log_entry_block.endswith('\n'):
+            new_log_entry_block += '\n'
+        try:
+            lines = _wiki_lines_cached(wiki_file_path, _wiki_file_version(wiki_file_path))
+        except FileNotFoundError:
+            lines = ()
+        except Exception as e:
+            self.display_error(f"Error reading wiki file {os.path.basename(wiki_file_path)} for daily log: {e}")
+            return False
+        daily_log_section_found = False
+        entry_date_lower = entry_date_str.lower()
+        daily_log_start_index = -1
+        today_date_header_index = -1
+        first_h3_after_daily_log_index = -1
+        for i, line in enumerate(lines):
+            if _is_titled(_parse_header(line), "daily log", 2):
+                daily_log_section_found = True
+                daily_log_start_index = i
+                for j in range(i + 1, len(lines)):
+                    header_j = _parse_header(lines[j])
+                    if header_j is None:
+                        continue
+                    if _is_heading(header_j, 2):
+                        break
+                    if _is_titled(header_j, entry_date_lower, 3):
+                        today_date_header_index = j
+                        break
+                    if first_h3_after_daily_log_index == -1 and _is_heading(header_j, 3):
+                        first_h3_after_daily_log_index = j
+                break
+        # Every case is "insert some lines at insert_at", so the wiki is written as head + inserted + tail
+        if not daily_log_section_found:
+            insert_at = len(lines)
+            inserted_lines = []
+            if lines and lines[-1].strip() != "":
+                inserted_lines.append("\n\n" if not lines[-1].endswith('\n') else "\n")
+            inserted_lines += [f"{daily_log_main_header}\n", f"{date_subheader}\n", new_log_entry_block]
+        elif today_date_header_index != -1:
+            insert_at = today_date_header_index + 1
+            section_end = insert_at
+            while section_end < len(lines) and not (_is_heading(_parse_header(lines[section_end]), 3)
+                                                     or _is_heading(_parse_header(lines[section_end]), 2)):
+                section_end += 1
+            if new_log_entry_block in "".join(lines[insert_at:section_end]):
+                self.update_status(f"Daily log for {entry_date_str} already has this entry; wiki not rewritten.")
+                return True
+            inserted_lines = [new_log_entry_block]
+        else:
+            insert_at = daily_log_start_index + 1
+            if first_h3_after_daily_log_index != -1:
+                insert_at = first_h3_after_daily_log_index
+            inserted_lines = [f"{date_subheader}\n", new_log_entry_block]
+            if insert_at < len(lines) and lines[insert_at].strip() != "" and not new_log_entry_block.endswith("\n\n"):
+                inserted_lines.append("\n")
+        try:
+            # Today's entry goes inside the existing section, which needs look-ahead, so the file is read whole;
+            # the write still goes through a temp file so a failure can't leave the wiki half-written
+            tmp_file = f"{wiki_file_path}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines[:insert_at])
+                f.writelines(inserted_lines)
+                f.writelines(lines[insert_at:])
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, wiki_file_path)
+            _clear_wiki_caches()
+            self.update_status(f"Daily log updated in {os.path.basename(wiki_file_path)} for {entry_date_str}")
+            return True
+        except Exception as e:
+            self.display_error(f"Error writing updated wiki file {os.path.basename(wiki_file_path)}: {e}")
+            return False
+
+
 # --- Recorder Thread ---
 class RecorderThread(QThread):
     update_signal = pyqtSignal(str)
-    recording_finished_signal = pyqtSignal(bytes, int)
+    chunk_ready_signal = pyqtSignal(str, bytes, str)  # chunk name, encoded audio, audio_digest of the samples
+    chunk_silent_signal = pyqtSignal(str)
+    chunk_failed_signal = pyqtSignal(str, str)  # chunk name, error message
+    recording_finished_signal = pyqtSignal(str, int)
 
-    def __init__(self):
+    def __init__(self, meeting_id, full_audio_path):
         super().__init__()
+        self.meeting_id = meeting_id
+        self.full_audio_path = full_audio_path
         self.is_recording = False
-        self.frames = []
+        self.total_bytes = 0
+        self.chunk_count = 0
         self.sample_width = 0
-        print("DEBUG: RecorderThread __init__ called")
+        logger.debug("RecorderThread __init__ called")
+
+    def _finish_chunk(self, samples):
+        """Encodes one chunk's samples in memory and hands them to transcription."""
+        self.chunk_count += 1
+        chunk_path = os.path.join(WAVE_OUTPUT_FOLDER, f"{self.meeting_id}_chunk_{self.chunk_count}.wav")
+        if chunk_rms(samples) < SILENCE_RMS_THRESHOLD:
+            # Nothing worth paying Whisper for; the chunk keeps its slot with an empty transcript
+            self.chunk_silent_signal.emit(chunk_path)
+            return
+        try:
+            pcm = memoryview(samples)
+            self.chunk_ready_signal.emit(chunk_path, encode_upload_audio(pcm, self.sample_width), audio_digest(pcm))
+        except Exception as e:
+            error_msg = f"Error preparing chunk {os.path.basename(chunk_path)}: {e}"
+            logger.error("RecorderThread: {}", error_msg)
+            # The chunk still needs its slot, or the meeting would be aggregated one chunk short
+            self.chunk_failed_signal.emit(chunk_path, error_msg)
+
+    def _open_full_wav(self):
+        try:
+            wf_full = wave.open(self.full_audio_path, 'wb')
+            wf_full.setnchannels(CHANNELS)
+            wf_full.setsampwidth(self.sample_width)
+            wf_full.setframerate(RATE)
+            return wf_full
+        except Exception as e:
+            error_msg = f"Error opening full audio file {os.path.basename(self.full_audio_path)}: {e}"
+            logger.error("RecorderThread: {}", error_msg)
+            self.update_signal.emit(error_msg)
+            self.full_audio_path = ""
+            return None
+
+    def _wav_writer_loop(self, writer_q):
+        """Streams captured audio blocks to the full-recording WAV on disk and into a preallocated
+        int16 chunk buffer that rolls over at chunk boundaries."""
+        samples_per_chunk = RATE * CHUNK_DURATION_SECONDS * CHANNELS
+        buf = np.empty(samples_per_chunk, dtype=np.int16)
+        cursor = 0
+        wf_full = self._open_full_wav()
+        while True:
+            data = writer_q.get()
+            if data is None:
+                break
+            self.total_bytes += len(data)
+            if wf_full is not None:
+                try:
+                    wf_full.writeframes(data)
+                except Exception as e:
+                    error_msg = f"Error writing full audio file: {e}"
+                    logger.error("RecorderThread: {}", error_msg)
+                    self.update_signal.emit(error_msg)
+                    wf_full = None
+                    self.full_audio_path = ""
+            block = np.frombuffer(data, dtype=np.int16)
+            while block.size:
+                take = min(block.size, samples_per_chunk - cursor)
+                buf[cursor:cursor + take] = block[:take]
+                cursor += take
+                block = block[take:]
+                if cursor == samples_per_chunk:
+                    # Hand the finished chunk to transcription while capture carries on
+                    self._finish_chunk(buf[:cursor])
+                    cursor = 0
+        if cursor:
+            self._finish_chunk(buf[:cursor])
+        if wf_full is not None:
+            try:
+                wf_full.close()
+            except Exception as e:
+                logger.error("RecorderThread: Error closing full audio file: {}", e)
+                self.full_audio_path = ""
 
     def run(self):
-        print("DEBUG: RecorderThread: run() method STARTED.")
+        logger.debug("RecorderThread: run() method STARTED.")
         self.is_recording = True
-        self.frames = []
+        self.total_bytes = 0
+        self.chunk_count = 0
         p = None
         stream = None
         try:
             self.update_signal.emit("RecorderThread: Initializing PyAudio...")
-            print("DEBUG: RecorderThread: Attempting: p = pyaudio.PyAudio()")
-            p = pyaudio.PyAudio()
-            print("DEBUG: RecorderThread: SUCCESS: p = pyaudio.PyAudio()")
+            logger.debug("RecorderThread: Attempting: p = pyaudio.PyAudio()")
+            p = get_pyaudio().PyAudio()
+            logger.debug("RecorderThread: SUCCESS: p = pyaudio.PyAudio()")
             self.update_signal.emit("RecorderThread: PyAudio initialized. Getting sample width...")
-            print(f"DEBUG: RecorderThread: Attempting: self.sample_width = p.get_sample_size(FORMAT={FORMAT})")
+            logger.debug("RecorderThread: Attempting: self.sample_width = p.get_sample_size(FORMAT={})", FORMAT)
             self.sample_width = p.get_sample_size(FORMAT)
-            print(f"DEBUG: RecorderThread: SUCCESS: self.sample_width = {self.sample_width}")
+            logger.debug("RecorderThread: SUCCESS: self.sample_width = {}", self.sample_width)
             self.update_signal.emit(f"RecorderThread: Sample width: {self.sample_width}. Opening stream...")
-            print(
-                f"DEBUG: RecorderThread: Attempting: stream = p.open(format={FORMAT}, channels={CHANNELS}, rate={RATE}, input=True, frames_per_buffer={CHUNK_READ_SIZE})")
+            logger.debug("RecorderThread: Attempting: stream = p.open(format={}, channels={}, rate={}, input=True, frames_per_buffer={})", FORMAT, CHANNELS, RATE, STREAM_BUFFER_FRAMES)
             stream = p.open(format=FORMAT,
                             channels=CHANNELS,
                             rate=RATE,
                             input=True,
-                            frames_per_buffer=CHUNK_READ_SIZE)
-            print("DEBUG: RecorderThread: SUCCESS: stream opened.")
+                            frames_per_buffer=STREAM_BUFFER_FRAMES)
+            logger.debug("RecorderThread: SUCCESS: stream opened.")
             self.update_signal.emit("Recording started...")
         except Exception as e:
             error_msg = f"Error initializing audio: {type(e).__name__} - {e}"
-            print(f"ERROR: RecorderThread: {error_msg}")
+            logger.error("RecorderThread: {}", error_msg)
             self.update_signal.emit(error_msg)
             self.is_recording = False
             if stream:
                 try:
                     stream.close()
                 except Exception as close_e:
-                    print(f"DEBUG: RecorderThread: Error closing stream during init error: {close_e}")
+                    logger.debug("RecorderThread: Error closing stream during init error: {}", close_e)
             if p:
                 try:
                     p.terminate()
                 except Exception as term_e:
-                    print(f"DEBUG: RecorderThread: Error terminating PyAudio during init error: {term_e}")
-            self.recording_finished_signal.emit(b"", 0)
-            print("DEBUG: RecorderThread: run() method ending due to initialization error.")
+                    logger.debug("RecorderThread: Error terminating PyAudio during init error: {}", term_e)
+            self.recording_finished_signal.emit("", 0)
+            logger.debug("RecorderThread: run() method ending due to initialization error.")
             return
 
-        print("DEBUG: RecorderThread: Entering recording loop...")
+        logger.debug("RecorderThread: Entering recording loop...")
         loop_count = 0
+        # Capture only reads; disk writes happen on the writer thread so slow storage can't drop frames
+        writer_q = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        writer_thread = threading.Thread(target=self._wav_writer_loop, args=(writer_q,), daemon=True)
+        writer_thread.start()
         while self.is_recording:
             try:
-                data = stream.read(CHUNK_READ_SIZE, exception_on_overflow=False)
-                self.frames.append(data)
+                writer_q.put(stream.read(CHUNK_READ_SIZE, exception_on_overflow=False))
             except IOError as e:
                 error_msg = f"Audio stream error in loop: {e}. Stopping recording."
-                print(f"ERROR: RecorderThread: {error_msg}")
+                logger.error("RecorderThread: {}", error_msg)
                 self.update_signal.emit(error_msg)
                 self.is_recording = False
             except Exception as e:
                 error_msg = f"Unexpected error in recording loop: {e}. Stopping recording."
-                print(f"ERROR: RecorderThread: {error_msg}")
+                logger.error("RecorderThread: {}", error_msg)
                 self.is_recording = False
 
-        print("DEBUG: RecorderThread: Exited recording loop.")
+        logger.debug("RecorderThread: Exited recording loop.")
         self.update_signal.emit("Recording stopped. Finalizing audio...")
-        print("DEBUG: RecorderThread: Attempting post-loop cleanup...")
+        logger.debug("RecorderThread: Attempting post-loop cleanup...")
         if stream:
             try:
-                print("DEBUG: RecorderThread: Stopping stream...")
+                logger.debug("RecorderThread: Stopping stream...")
                 stream.stop_stream()
-                print("DEBUG: RecorderThread: Closing stream...")
+                logger.debug("RecorderThread: Closing stream...")
                 stream.close()
-                print("DEBUG: RecorderThread: Stream closed.")
+                logger.debug("RecorderThread: Stream closed.")
             except Exception as close_e:
-                print(f"ERROR: RecorderThread: Error closing stream post-loop: {close_e}")
+                logger.error("RecorderThread: Error closing stream post-loop: {}", close_e)
         if p:
             try:
-                print("DEBUG: RecorderThread: Terminating PyAudio instance...")
+                logger.debug("RecorderThread: Terminating PyAudio instance...")
                 p.terminate()
-                print("DEBUG: RecorderThread: PyAudio instance terminated.")
+                logger.debug("RecorderThread: PyAudio instance terminated.")
             except Exception as term_e:
-                print(f"ERROR: RecorderThread: Error terminating PyAudio post-loop: {term_e}")
-        print("DEBUG: RecorderThread: PyAudio resources cleanup attempted.")
-        full_audio_data = b''.join(self.frames)
-        self.update_signal.emit(f"Total audio data size: {len(full_audio_data)} bytes")
-        self.recording_finished_signal.emit(full_audio_data, self.sample_width)
-        print("DEBUG: RecorderThread: recording_finished_signal emitted. Run method ending.")
+                logger.error("RecorderThread: Error terminating PyAudio post-loop: {}", term_e)
+        logger.debug("RecorderThread: PyAudio resources cleanup attempted.")
+        writer_q.put(None)
+        writer_thread.join()
+        self.update_signal.emit(f"Total audio data size: {self.total_bytes} bytes")
+        self.recording_finished_signal.emit(self.full_audio_path if self.total_bytes else "", self.sample_width)
+        logger.debug("RecorderThread: recording_finished_signal emitted. Run method ending.")
 
     def stop(self):
-        print("DEBUG: RecorderThread stop() called")
+        logger.debug("RecorderThread stop() called")
         self.is_recording = False
 
 
 # --- Meeting Data & History ---
 class MeetingData:
     def __init__(self, meeting_id, name, date, project_name, summary_path, transcript_path, # mentor_feedback_path=None, # <<< REMOVED
-                 full_audio_path=None, json_notes_path=None):
+                 full_audio_path=None, json_notes_path=None, chunk_paths=None):
         self.meeting_id = meeting_id;
         self.name = name;
         self.date = date;
@@ -757,13 +2166,31 @@ class MeetingData:
         # self.mentor_feedback_path = mentor_feedback_path; # <<< REMOVED
         self.full_audio_path = full_audio_path;
         self.json_notes_path = json_notes_path
+        self.chunk_paths = chunk_paths  # Chunk WAVs on disk; None for records saved before this was tracked
+        # Resolved once; the app never changes its working directory
+        self.resolved_notes_path = os.path.abspath(json_notes_path) \
+            if isinstance(json_notes_path, str) and json_notes_path.strip() else None
+        try:
+            self.date_dt = datetime.strptime(date, "%Y-%m-%d %H:%M")  # Parsed once for date-range lookups
+        except (TypeError, ValueError):
+            self.date_dt = None
+
+    def notes_mtime(self):
+        """mtime of the notes file, or None if there is none. A single stat, and the result can be handed
+        to load_notes_file so the file isn't stat'ed again."""
+        if not self.resolved_notes_path:
+            return None
+        try:
+            return os.stat(self.resolved_notes_path).st_mtime
+        except OSError:
+            return None
 
     def to_dict(self):
         return {"meeting_id": self.meeting_id, "name": self.name, "date": self.date, "project_name": self.project_name,
                 "summary_path": self.summary_path, "transcript_path": self.transcript_path,
                 # "mentor_feedback_path": self.mentor_feedback_path, # <<< REMOVED
                 "full_audio_path": self.full_audio_path,
-                "json_notes_path": self.json_notes_path}
+                "json_notes_path": self.json_notes_path, "chunk_paths": self.chunk_paths}
 
     @classmethod
     def from_dict(cls, data):
@@ -771,56 +2198,205 @@ class MeetingData:
                    data.get("project_name", "Unknown"), data.get("summary_path", ""), data.get("transcript_path", ""),
                    # data.get("mentor_feedback_path", None), # <<< REMOVED
                    data.get("full_audio_path", None),
-                   data.get("json_notes_path", None))
+                   data.get("json_notes_path", None), data.get("chunk_paths", None))
 
 
 class MeetingHistory:
-    def __init__(self, history_file=HISTORY_FILE):
+    def __init__(self, history_file=HISTORY_FILE, lazy=False):
         self.history_file = history_file;
-        self.meetings = [];
-        self.load_history()
+        self._meetings = [];
+        self._by_project = {}
+        self._by_id = {}
+        self._loaded_mtime = None
+        self._ready = threading.Event()
+        if not lazy:  # With lazy=True the caller runs load_history() itself, typically via HistoryLoadWorker
+            self.load_history()
+
+    @property
+    def meetings(self):
+        # Only blocks if the history is used before a background load has finished
+        self._ready.wait()
+        return self._meetings
+
+    @meetings.setter
+    def meetings(self, meetings):
+        self._meetings = meetings
+        self._rebuild_index()
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
 
     def load_history(self):
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.meetings = [MeetingData.from_dict(m) for m in json.load(f)]
+                mtime = os.path.getmtime(self.history_file)
+                if mtime != self._loaded_mtime:  # Unchanged since the last load or save: nothing to re-read
+                    with open(self.history_file, 'rb') as f:
+                        self._meetings = [MeetingData.from_dict(m) for m in json_loads(f.read())]
+                    self._loaded_mtime = mtime
             except Exception as e:
-                print(f"Error loading history {self.history_file}: {e}"); self.meetings = []
+                logger.error("Error loading history {}: {}", self.history_file, e); self._meetings = []
+        try:
+            self._rebuild_index()
+        finally:
+            self._ready.set()  # Never leave readers of self.meetings waiting
+
+    def _rebuild_index(self):
+        """Groups meetings by lower-cased project name as parallel (dates, meetings) lists sorted by date,
+        and maps meeting_id to meeting for get_meeting."""
+        self._by_id = {m.meeting_id: m for m in self._meetings}
+        by_project = {}
+        for meeting in sorted((m for m in self._meetings if m.project_name and m.date_dt is not None),
+                              key=lambda m: m.date_dt):
+            dates, meetings = by_project.setdefault(meeting.project_name.lower(), ([], []))
+            dates.append(meeting.date_dt)
+            meetings.append(meeting)
+        self._by_project = by_project
+
+    def meetings_in_range(self, project_name, start_datetime, end_datetime):
+        """Meetings of a project (case-insensitive) dated within [start_datetime, end_datetime], oldest first."""
+        self._ready.wait()
+        dates, meetings = self._by_project.get(project_name.lower(), ([], []))
+        lo = bisect.bisect_left(dates, start_datetime)
+        hi = bisect.bisect_right(dates, end_datetime)
+        return meetings[lo:hi]
+
+    def get_meeting(self, meeting_id):
+        self._ready.wait()
+        return self._by_id.get(meeting_id)
+
+    def replace_meeting(self, meeting):
+        """Swaps in a new record for an existing meeting_id; the caller saves. Returns False if the id is unknown."""
+        existing = self.get_meeting(meeting.meeting_id)
+        if existing is None: return False
+        self._meetings[self._meetings.index(existing)] = meeting
+        self._by_id[meeting.meeting_id] = meeting
+        return True
 
     def add_meeting(self, meeting):
-        self.meetings.append(meeting); self.save_history()
+        self._ready.wait()  # A load finishing afterwards would replace self._meetings and lose the append
+        self._meetings.append(meeting); self.save_history()
+
+    def upsert_meeting(self, meeting):
+        """Replaces the record with the same meeting_id, or appends it, and saves once. True if one was replaced."""
+        replaced = self.replace_meeting(meeting)
+        if not replaced:
+            self._meetings.append(meeting)
+        self.save_history()
+        return replaced
 
     def delete_meeting(self, meeting_id):
-        meeting = next((m for m in self.meetings if m.meeting_id == meeting_id), None)
+        self._ready.wait()
+        meeting = self._by_id.get(meeting_id)
         if not meeting: return False
         # files_to_delete = [meeting.transcript_path, meeting.summary_path, meeting.mentor_feedback_path, # <<< MENTOR PATH REMOVED
         #                    meeting.full_audio_path, meeting.json_notes_path,
         #                    *glob.glob(f"{WAVE_OUTPUT_FOLDER}/{meeting.meeting_id}_chunk_*.wav")]
+        # Each folder is listed once and existence is checked against the listing instead of a stat per file
+        folder_names = {}
+
+        def names_in(folder):
+            if folder not in folder_names:
+                try:
+                    with os.scandir(folder) as entries:
+                        folder_names[folder] = {entry.name for entry in entries}
+                except OSError:
+                    folder_names[folder] = set()
+            return folder_names[folder]
+
         files_to_delete = [meeting.transcript_path, meeting.summary_path,
-                           meeting.full_audio_path, meeting.json_notes_path,
-                           *glob.glob(f"{WAVE_OUTPUT_FOLDER}/{meeting.meeting_id}_chunk_*.wav")]
+                           meeting.full_audio_path, meeting.json_notes_path]
+        if meeting.chunk_paths is not None:
+            files_to_delete.extend(meeting.chunk_paths)
+        else:
+            # Legacy record: chunk files weren't tracked, so look for them in the audio folder
+            chunk_prefix = f"{meeting.meeting_id}_chunk_"
+            files_to_delete.extend(os.path.join(WAVE_OUTPUT_FOLDER, name)
+                                   for name in names_in(os.path.abspath(WAVE_OUTPUT_FOLDER))
+                                   if name.startswith(chunk_prefix) and name.endswith(".wav"))
         # Check for mentor_feedback_path attribute before trying to access it, for backward compatibility if old data exists
         if hasattr(meeting, 'mentor_feedback_path') and meeting.mentor_feedback_path:
              files_to_delete.append(meeting.mentor_feedback_path)
 
         for file_path in files_to_delete:
-            if file_path and os.path.exists(file_path):
+            if file_path and os.path.basename(file_path) in names_in(os.path.dirname(os.path.abspath(file_path))):
                 try:
-                    os.remove(file_path); print(f"Deleted file: {file_path}")
+                    os.remove(file_path); logger.info("Deleted file: {}", file_path)
                 except Exception as e:
-                    print(f"Error deleting file {file_path}: {e}")
-        self.meetings = [m for m in self.meetings if m.meeting_id != meeting_id];
+                    logger.error("Error deleting file {}: {}", file_path, e)
+        # Cache entries are keyed by request content, not by meeting, so the only way to be sure none of the deleted
+        # meeting's transcripts, summaries or notes stay on disk is to drop them all; they are only re-fetched on demand
+        cleared = clear_cache()
+        if cleared:
+            logger.info("Cleared {} response cache entries.", cleared)
+        self._meetings = [m for m in self._meetings if m.meeting_id != meeting_id];
         self.save_history();
         return True
 
     def save_history(self):
+        # Every change to self.meetings is followed by a save, so the index is refreshed here
+        self._rebuild_index()
         try:
             os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([m.to_dict() for m in self.meetings], f, indent=2)
+            # Written beside the real file and swapped in, so a crash mid-write can't leave a truncated history
+            tmp_file = f"{self.history_file}.tmp"
+            json_dump_file([m.to_dict() for m in self._meetings], tmp_file, indent=True)
+            os.replace(tmp_file, self.history_file)
+            self._loaded_mtime = os.path.getmtime(self.history_file)
         except IOError as e:
-            print(f"Error saving history file {self.history_file}: {e}")
+            logger.error("Error saving history file {}: {}", self.history_file, e)
+
+
+class MeetingListModel(QAbstractListModel):
+    """History list rows, newest first. Single-row changes avoid rebuilding the whole view."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        meeting = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{meeting.name} ({meeting.project_name} - {meeting.date})"
+        if role == Qt.UserRole:
+            return meeting.meeting_id
+        return None
+
+    def set_meetings(self, meetings):
+        self.beginResetModel()
+        self._rows = sorted(meetings, key=lambda m: m.date, reverse=True)
+        self.endResetModel()
+
+    def _row_of(self, meeting_id):
+        return next((i for i, m in enumerate(self._rows) if m.meeting_id == meeting_id), -1)
+
+    def upsert_meeting(self, meeting):
+        row = self._row_of(meeting.meeting_id)
+        if row != -1 and self._rows[row].date == meeting.date:
+            self._rows[row] = meeting
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+        if row != -1:
+            self.remove_meeting(meeting.meeting_id)
+        # Same position sorted(reverse=True) would give: after any rows with an equal or newer date
+        row = next((i for i, m in enumerate(self._rows) if m.date < meeting.date), len(self._rows))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, meeting)
+        self.endInsertRows()
+
+    def remove_meeting(self, meeting_id):
+        row = self._row_of(meeting_id)
+        if row == -1:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
 
 
 # --- Main Application Window ---
@@ -831,7 +2407,12 @@ class MeetingTranscriberApp(QMainWindow):
         self.setGeometry(100, 100, 800, 600) # Adjusted height a bit as mentor feedback is gone
         self.api_key = OPENAI_API_KEY;
         self.api_key_valid = bool(self.api_key)
-        self.history = MeetingHistory();
+        # API clients hold no per-request state, so one instance of each is shared by all workers
+        self.whisper = WhisperTranscriber(self.api_key)
+        self.summarizer = LLMSummarizer(self.api_key)
+        self.json_extractor = LLMJsonExtractor(self.api_key)
+        self.analyzer = LLMMeetingAnalyzer(self.api_key)
+        self.history = MeetingHistory(lazy=True);
         self.recorder_thread = None;
         self.current_meeting_id = None
         self.is_recording = False;
@@ -839,14 +2420,30 @@ class MeetingTranscriberApp(QMainWindow):
         self.processing_active = False
         self.threadpool = QThreadPool();
         self.threadpool.setMaxThreadCount(3)
-        print(f"Multithreading with maximum {self.threadpool.maxThreadCount()} threads")
+        logger.info("Multithreading with maximum {} threads", self.threadpool.maxThreadCount())
+        # All network-bound workers (Whisper and LLM requests) share one pool. Its threads only wait on
+        # sockets, so they run with a small stack; self.threadpool is left for local work.
+        self.io_pool = QThreadPool()
+        self.io_pool.setMaxThreadCount(MAX_CONCURRENT_TRANSCRIPTIONS + MAX_CONCURRENT_LLM_REQUESTS)
+        self.io_pool.setStackSize(IO_THREAD_STACK_BYTES)
+        # Wiki edits run one at a time, so two applies to the same wiki can't race and land in the order made
+        self.wiki_pool = QThreadPool()
+        self.wiki_pool.setMaxThreadCount(1)
+        self.transcription_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
         # State variables
         self.current_meeting_name = "";
         self.current_project_name = "";
         self.full_audio_file_path = ""
         self.pending_chunk_files = [];
+        self.all_chunks_dispatched = False
         self.chunk_transcripts = {};
+        self.failed_chunks = set()  # Chunk indices whose transcript is an [ERROR: ...] placeholder
+        self._pending_outputs = set()  # "notes"/"summary" still being generated; the meeting is finalized once empty
         self.transcriptions_done = 0;
+        self._recap_heading = ("", "Last Week")  # (project, week title) of the recap being generated
+        self._transcript_prefix = []  # Chunk transcripts received so far without gaps, in chunk order
+        self._transcript_prefix_chars = 0
+        self._parts_prefetched = 0
         self.total_chunks = 0
         self.full_meeting_transcript = "";
         self.final_summary = "";
@@ -863,212 +2460,141 @@ class MeetingTranscriberApp(QMainWindow):
         if not self.api_key_valid: QMessageBox.warning(self, "API Key Missing",
                                                        "OPENAI_API_KEY not found. Please set it and restart.")
 
-    def start_post_processing(self, full_audio_data, sample_width):
+    def start_post_processing(self, full_audio_path, sample_width):
         self.update_status("Post-processing started...")
-        QApplication.processEvents()
 
         if not self.current_meeting_id:
             self.display_error("Critical: current_meeting_id not set before post-processing.")
             self.finalize_meeting_processing(success=False)
             return
 
-        if not self.full_audio_file_path:
-            self.full_audio_file_path = os.path.join(WAVE_OUTPUT_FOLDER, f"{self.current_meeting_id}_full.wav")
-            self.update_status(f"Saving full audio to: {self.full_audio_file_path}")
-            try:
-                with wave.open(self.full_audio_file_path, 'wb') as wf:
-                    wf.setnchannels(CHANNELS)
-                    wf.setsampwidth(sample_width)
-                    wf.setframerate(RATE)
-                    wf.writeframes(full_audio_data)
-                self.update_status("Full audio saved.")
-            except Exception as e:
-                self.display_error(f"Error saving full audio: {e}")
-                self.full_audio_file_path = ""
-                self.finalize_meeting_processing(success=False)
-                return
-        else:
-            self.update_status(f"Using existing full audio: {self.full_audio_file_path}")
+        has_full_audio = bool(full_audio_path and os.path.exists(full_audio_path))
+        self.full_audio_file_path = full_audio_path if has_full_audio else ""
+        if has_full_audio:
+            self.update_status(f"Using full audio: {self.full_audio_file_path}")
+
+        if self.pending_chunk_files:
+            # Chunks were already handed to transcription by the recorder during capture; they don't need the
+            # full WAV, so a recording whose full file couldn't be written still waits for them
+            self.total_chunks = len(self.pending_chunk_files)
+            self.all_chunks_dispatched = True
+            self.update_status(f"Recording split into {self.total_chunks} chunks. Waiting for remaining transcriptions...")
+            self.check_all_transcriptions_done()
+            return
 
-        if not full_audio_data:
+        if not has_full_audio:
             self.update_status("No audio data to process. Finalizing.")
             self.aggregate_and_start_notes()
             return
 
-        bytes_per_sample = sample_width * CHANNELS
-        if bytes_per_sample == 0:
-            self.display_error("Audio sample width is zero. Cannot process.")
-            self.finalize_meeting_processing(success=False)
-            return
-
-        frames_per_chunk_duration = RATE * CHUNK_DURATION_MINUTES * 60
-        bytes_per_chunk_duration = frames_per_chunk_duration * bytes_per_sample
-
-        if bytes_per_chunk_duration == 0:
-            self.display_error(
-                "Calculated bytes per chunk is zero (check RATE/CHUNK_DURATION_MINUTES). Cannot process.")
+        # Chunking works on frame counts from the WAV header, so the sample width never enters the math
+        frames_per_chunk_duration = RATE * CHUNK_DURATION_SECONDS
+        try:
+            with wave.open(full_audio_path, 'rb') as wf_full:
+                total_frames = wf_full.getnframes()
+        except (OSError, EOFError, wave.Error) as e:
+            self.display_error(f"Error reading full audio for chunking: {e}")
             self.finalize_meeting_processing(success=False)
             return
-
-        total_bytes = len(full_audio_data)
-        if total_bytes == 0:
-            self.total_chunks = 0
-        else:
-            self.total_chunks = math.ceil(total_bytes / bytes_per_chunk_duration)
-            self.total_chunks = int(self.total_chunks)
-            if self.total_chunks == 0 and total_bytes > 0:
-                self.total_chunks = 1
+        full_chunks, remaining_frames = divmod(total_frames, frames_per_chunk_duration)
+        self.total_chunks = full_chunks + (1 if remaining_frames else 0)
 
         if self.total_chunks == 0:
             self.update_status("No audio data sufficient to create chunks. Finalizing.")
             self.aggregate_and_start_notes()
             return
 
-        self.update_status(f"Splitting audio into {self.total_chunks} chunks...")
-        QApplication.processEvents()
-
-        for i in range(self.total_chunks):
-            start_byte = i * bytes_per_chunk_duration
-            end_byte = start_byte + bytes_per_chunk_duration
-            chunk_data = full_audio_data[start_byte:end_byte]
-            if not chunk_data:
-                continue
-            chunk_filename = f"{self.current_meeting_id}_chunk_{i + 1}.wav"
-            chunk_file_path = os.path.join(WAVE_OUTPUT_FOLDER, chunk_filename)
-            self.pending_chunk_files.append(chunk_file_path)
-            try:
-                with wave.open(chunk_file_path, 'wb') as wf_chunk:
-                    wf_chunk.setnchannels(CHANNELS)
-                    wf_chunk.setsampwidth(sample_width)
-                    wf_chunk.setframerate(RATE)
-                    wf_chunk.writeframes(chunk_data)
-            except Exception as e:
-                self.display_error(f"Error saving chunk {chunk_filename}: {e}")
-
-        if not self.pending_chunk_files:
-            self.update_status("No audio chunks were successfully prepared. Finalizing.")
-            self.aggregate_and_start_notes()
-            return
-
-        self.total_chunks = len(self.pending_chunk_files)
-        if self.total_chunks == 0:
-            self.update_status("No valid audio chunks to process after attempting to split. Finalizing.")
-            self.aggregate_and_start_notes()
-            return
-
+        # Chunks are never written out: each batch worker reads its frame range straight from the full WAV
+        self.pending_chunk_files = [os.path.join(WAVE_OUTPUT_FOLDER, f"{self.current_meeting_id}_chunk_{i + 1}.wav")
+                                    for i in range(self.total_chunks)]
         self.update_status(f"Starting transcription for {self.total_chunks} chunks...")
-        QApplication.processEvents()
-        actual_chunks_being_transcribed = 0
-        for chunk_path in self.pending_chunk_files:
-            if not os.path.exists(chunk_path):
-                self.update_status(f"Skipping transcription for missing chunk: {os.path.basename(chunk_path)}")
-                self.handle_chunk_transcription_error(f"Audio chunk file not found before starting worker.", chunk_path)
-                continue
-            actual_chunks_being_transcribed += 1
-            worker = TranscriptionWorker(chunk_path, self.api_key)
-            worker.signals.transcription_result.connect(self.handle_chunk_transcription_result)
-            error_slot = functools.partial(self.handle_chunk_transcription_error, chunk_path=chunk_path)
-            worker.signals.error.connect(error_slot)
-            self.threadpool.start(worker)
-
-        if actual_chunks_being_transcribed == 0 and self.pending_chunk_files:
-            self.update_status("All prepared audio chunks were missing. Finalizing processing.")
-        elif actual_chunks_being_transcribed < len(self.pending_chunk_files):
-            self.update_status(
-                f"Started transcription for {actual_chunks_being_transcribed} (out of {len(self.pending_chunk_files)} prepared) chunks due to some missing files.")
-        elif actual_chunks_being_transcribed == 0:
-            self.update_status("No chunks to transcribe.")
-            self.aggregate_and_start_notes()
+        self.all_chunks_dispatched = True
+        for batch_start_index in range(0, self.total_chunks, WHISPER_BATCH_CHUNKS):
+            batch_paths = self.pending_chunk_files[batch_start_index:batch_start_index + WHISPER_BATCH_CHUNKS]
+            self._start_batch_transcription(batch_paths, batch_start_index * frames_per_chunk_duration,
+                                            frames_per_chunk_duration)
+
+    def _whisper_prompt_for_chunk(self, chunk_index):
+        """Returns the tail of the previous chunk's transcript, if already available, to keep context across chunks."""
+        previous_text = self.chunk_transcripts.get(chunk_index - 1)
+        if not previous_text or previous_text.startswith("[ERROR:"):
+            return None
+        tail = previous_text[-WHISPER_PROMPT_TAIL_CHARS:]
+        if len(previous_text) > WHISPER_PROMPT_TAIL_CHARS and " " in tail:
+            tail = tail.split(" ", 1)[1]
+        return tail.strip() or None
+
+    def _start_chunk_transcription(self, chunk_path, audio_bytes, chunk_index, pcm_digest=None):
+        prompt = self._whisper_prompt_for_chunk(chunk_index)
+        worker = TranscriptionWorker(chunk_path, audio_bytes, self.whisper, self.transcription_semaphore, prompt,
+                                     pcm_digest)
+        worker.signals.transcription_result.connect(self.handle_chunk_transcription_result)
+        error_slot = functools.partial(self.handle_chunk_transcription_error, chunk_path=chunk_path)
+        worker.signals.error.connect(error_slot)
+        self.io_pool.start(worker)
+
+    def _start_batch_transcription(self, chunk_paths, first_frame, frames_per_chunk):
+        worker = BatchTranscriptionWorker(list(chunk_paths), self.full_audio_file_path, first_frame, frames_per_chunk,
+                                          self.whisper, self.transcription_semaphore)
+        worker.signals.transcription_result.connect(self.handle_chunk_transcription_result)
+        worker.signals.transcription_error.connect(self.handle_chunk_transcription_error)
+        self.io_pool.start(worker)
+
+    def handle_recorded_chunk(self, chunk_path, audio_bytes, pcm_digest):
+        """Starts transcribing a chunk as soon as the recorder closes it, overlapping upload with capture."""
+        self.pending_chunk_files.append(chunk_path)
+        self.update_status(f"Chunk ready: {os.path.basename(chunk_path)}. Transcribing while recording continues...")
+        self._start_chunk_transcription(chunk_path, audio_bytes, len(self.pending_chunk_files) - 1, pcm_digest)
+
+    def handle_silent_chunk(self, chunk_path):
+        self.pending_chunk_files.append(chunk_path)
+        self.update_status(f"Chunk {os.path.basename(chunk_path)} is silent. Skipping transcription.")
+        self.handle_chunk_transcription_result("", chunk_path)
+
+    def handle_failed_chunk(self, chunk_path, error_message):
+        self.pending_chunk_files.append(chunk_path)
+        self.handle_chunk_transcription_error(error_message, chunk_path)
 
     def generate_weekly_recap(self):
-        print("\nDEBUG: ============================================")
-        print("DEBUG: Entered generate_weekly_recap")
+        logger.debug("============================================")
+        logger.debug("Entered generate_weekly_recap")
         target_project = self.report_project_edit.text().strip()
         if not target_project:
             self.display_error(
                 "Please enter a project name in the 'Report Project' field.")
-            print("DEBUG: Exiting generate_weekly_recap (no target project entered)")
+            logger.debug("Exiting generate_weekly_recap (no target project entered)")
             return
         if self.processing_active or self.is_recording:
             self.display_error("Cannot generate recap while recording or processing is active.")
-            print("DEBUG: Exiting generate_weekly_recap (processing or recording active)")
+            logger.debug("Exiting generate_weekly_recap (processing or recording active)")
             return
         self.update_status(f"Generating weekly recap for project: {target_project}...")
-        print("DEBUG: Recap: Disabling buttons and clearing text...")
+        logger.debug("Recap: Disabling buttons and clearing text...")
         self.generate_recap_button.setEnabled(False)
         self.generate_report_button.setEnabled(False)
         self.report_output_text.clear()
-        print("DEBUG: Recap: Calling QApplication.processEvents()...")
-        QApplication.processEvents()
-        print("DEBUG: Recap: QApplication.processEvents() finished.")
-        print("DEBUG: Recap: Calculating date range...")
         try:
             today = datetime.now().date()
-            print(f"DEBUG: Recap:   today = {today}")
             days_past_friday = (today.weekday() - 4) % 7
-            print(f"DEBUG: Recap:   days_past_friday = {days_past_friday}")
             most_recent_friday = today - timedelta(days=days_past_friday)
-            print(f"DEBUG: Recap:   most_recent_friday = {most_recent_friday}")
             start_of_recap_week_monday = most_recent_friday - timedelta(days=4)
-            print(f"DEBUG: Recap:   start_of_recap_week_monday = {start_of_recap_week_monday}")
             start_datetime = datetime.combine(start_of_recap_week_monday, datetime.min.time())
             end_datetime = datetime.combine(most_recent_friday, datetime.max.time())
-            print(f"DEBUG: Recap:   start_datetime = {start_datetime}")
-            print(f"DEBUG: Recap:   end_datetime = {end_datetime}")
         except Exception as date_e:
-            print(f"ERROR: Recap: Failed during date calculation: {date_e}")
+            logger.error("Recap: Failed during date calculation: {}", date_e)
             self.display_error(f"Error calculating date range: {date_e}")
             self.generate_recap_button.setEnabled(True)
             self.generate_report_button.setEnabled(True)
             return
-        print("DEBUG: Recap: Date calculation complete.")
-        print(f"DEBUG: Recap Target Project (lower): {target_project.lower()}")
-        print(
-            f"DEBUG: Recap Date Range: {start_datetime.strftime('%Y-%m-%d %H:%M:%S')} to {end_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.debug("Recap Date Range: {} to {}", start_datetime.strftime('%Y-%m-%d %H:%M:%S'), end_datetime.strftime('%Y-%m-%d %H:%M:%S'))
         relevant_meetings = []
-        history_list_length = -1
-        try:
-            history_list_length = len(self.history.meetings)
-            print(f"DEBUG: Recap: Accessing meeting history (Length = {history_list_length}). Preparing to iterate...")
-        except Exception as hist_e:
-            print(f"ERROR: Recap: Failed to access self.history.meetings: {hist_e}")
-            self.display_error(f"Error accessing meeting history: {hist_e}")
-            self.generate_recap_button.setEnabled(True)
-            self.generate_report_button.setEnabled(True)
-            return
-        print(f"DEBUG: Recap: Starting iteration through {history_list_length} meetings...")
-        for i, meeting in enumerate(self.history.meetings):
-            print(f"DEBUG: Recap: --- Iteration {i} ---")
-            meeting_id = getattr(meeting, 'meeting_id', 'N/A')
-            meeting_name = getattr(meeting, 'name', 'N/A')
-            print(f"DEBUG: Recap: Processing meeting index {i}, ID: {meeting_id}, Name: {meeting_name}")
-            try:
-                meeting_project_name = getattr(meeting, 'project_name', None)
-                meeting_date_str = getattr(meeting, 'date', None)
-                meeting_notes_path = getattr(meeting, 'json_notes_path', None)
-                if not all([meeting_project_name, meeting_date_str, meeting_notes_path]):
-                    continue
-                if meeting_project_name.lower() == target_project.lower():
-                    try:
-                        meeting_date = datetime.strptime(meeting_date_str, "%Y-%m-%d %H:%M")
-                        if start_datetime <= meeting_date <= end_datetime:
-                            print(f"DEBUG: Recap:   Date is within range for {meeting_name}.")
-                            full_notes_path = os.path.abspath(meeting_notes_path)
-                            if os.path.exists(full_notes_path):
-                                print(f"DEBUG: Recap:   Notes file exists. Adding meeting.")
-                                relevant_meetings.append(meeting)
-                    except ValueError as ve:
-                        print(
-                            f"ERROR: Recap: Could not parse date '{meeting_date_str}' for meeting '{meeting_name}': {ve}")
-                        continue
-                    except Exception as date_check_e:
-                        print(
-                            f"ERROR: Recap: Error during date parsing/checking for meeting '{meeting_name}': {date_check_e}")
-                        continue
-            except Exception as e:
-                print(
-                    f"ERROR: Recap: Unexpected error processing meeting {i} ('{meeting_name}') for recap: {type(e).__name__} - {e}")
-        print(f"DEBUG: Recap: Finished filtering loop. Found {len(relevant_meetings)} relevant meetings.")
+        notes_mtimes = []
+        for meeting in self.history.meetings_in_range(target_project, start_datetime, end_datetime):
+            notes_mtime = meeting.notes_mtime()
+            if notes_mtime is not None:
+                relevant_meetings.append(meeting)
+                notes_mtimes.append(notes_mtime)
+        logger.debug("Recap: Found {} relevant meetings.", len(relevant_meetings))
         if not relevant_meetings:
             report_md = f"## Weekly Recap: {target_project}\n"
             report_md += f"({start_datetime.strftime('%Y-%m-%d')} to {end_datetime.strftime('%Y-%m-%d')})\n\n"
@@ -1077,62 +2603,25 @@ class MeetingTranscriberApp(QMainWindow):
             self.update_status(f"Recap generated: No relevant meetings found for {target_project}.")
             self.generate_recap_button.setEnabled(True)
             self.generate_report_button.setEnabled(True)
-            print("DEBUG: Exiting generate_weekly_recap (no relevant meetings).")
-            print("DEBUG: ============================================\n")
+            logger.debug("Exiting generate_weekly_recap (no relevant meetings).")
+            logger.debug("============================================")
             return
         all_decisions = []
         all_action_items = []
         all_risks = []
         all_open_questions = []
         processed_meeting_names = set()
-        print(f"DEBUG: Recap: Aggregating data from {len(relevant_meetings)} meetings...")
-        try:
-            print("DEBUG: Recap: Sorting relevant meetings before aggregation...")
-            relevant_meetings.sort(key=lambda m: datetime.strptime(m.date, "%Y-%m-%d %H:%M"))
-            print("DEBUG: Recap: Sorting complete.")
-        except Exception as sort_e:
-            print(f"ERROR: Recap: Failed to sort relevant meetings: {sort_e}")
-        for meeting in relevant_meetings:
-            meeting_name = getattr(meeting, 'name', 'Unknown Meeting')
-            notes_path = getattr(meeting, 'json_notes_path', None)
-            meeting_date_str = getattr(meeting, 'date', 'N/A')
-            processed_meeting_names.add(f"{meeting_name} ({meeting_date_str})")
-            if not notes_path: continue
+        logger.debug("Recap: Aggregating data from {} meetings...", len(relevant_meetings))
+        notes_paths = [meeting.resolved_notes_path for meeting in relevant_meetings]
+        loaded_notes = load_notes_files(notes_paths, notes_mtimes)  # All files are read and parsed concurrently first
+        for meeting, full_notes_path, (notes_data, load_error) in zip(relevant_meetings, notes_paths, loaded_notes):
+            processed_meeting_names.add(f"{meeting.name} ({meeting.date})")
             try:
-                full_notes_path = os.path.abspath(notes_path)
-                print(f"DEBUG: Recap:   Aggregating notes file: {full_notes_path}")
-                with open(full_notes_path, 'r', encoding='utf-8') as f:
-                    notes_content = f.read()
-                if not notes_content.strip():
-                    print(f"WARNING: Recap: Notes file is empty: {full_notes_path}")
-                    continue
-                notes_data = None
-                try:
-                    initial_data = json.loads(notes_content)
-                    if isinstance(initial_data, dict) and \
-                            initial_data.get("error") == "LLM did not return valid JSON format." and \
-                            "raw_output" in initial_data:
-                        raw_output_str = initial_data.get("raw_output", "")
-                        cleaned_str = raw_output_str.strip()
-                        if cleaned_str.startswith("```json"):
-                            cleaned_str = cleaned_str[len("```json"):].strip()
-                        elif cleaned_str.startswith("```"):
-                            cleaned_str = cleaned_str[len("```"):].strip()
-                        if cleaned_str.endswith("```"): cleaned_str = cleaned_str[:-len("```")].strip()
-                        if cleaned_str:
-                            try:
-                                notes_data = json.loads(cleaned_str)
-                            except json.JSONDecodeError as inner_jde:
-                                print(f"ERROR: Recap:     Could not parse cleaned raw_output as JSON: {inner_jde}")
-                                notes_data = {"error_parsing_raw": f"Failed: {inner_jde}"}
-                        else:
-                            print("ERROR: Recap:     Cleaned raw_output string is empty.")
-                            notes_data = {"error_parsing_raw": "Empty raw output"}
-                    else:
-                        notes_data = initial_data
-                except json.JSONDecodeError as outer_jde:
-                    print(
-                        f"ERROR: Recap: Could not decode initial JSON from file: {full_notes_path}. Error: {outer_jde}")
+                logger.debug("Recap:   Aggregating notes file: {}", full_notes_path)
+                if load_error is not None:
+                    raise load_error
+                if notes_data is None:
+                    logger.warning("Recap: Notes file is empty: {}", full_notes_path)
                     continue
                 if isinstance(notes_data, dict) and "error_parsing_raw" not in notes_data:
                     decisions = notes_data.get("decisions", [])
@@ -1144,54 +2633,51 @@ class MeetingTranscriberApp(QMainWindow):
                     if isinstance(risks, list): all_risks.extend(risks)
                     if isinstance(questions, list): all_open_questions.extend(questions)
                 elif isinstance(notes_data, dict) and "error_parsing_raw" in notes_data:
-                    print(
-                        f"WARNING: Recap: Skipping aggregation for {full_notes_path} due to raw_output parsing error.")
+                    logger.warning("Recap: Skipping aggregation for {} due to raw_output parsing error.", full_notes_path)
                 else:
-                    print(
-                        f"WARNING: Recap: Skipping aggregation for {full_notes_path} because notes_data is not a valid dictionary.")
+                    logger.warning("Recap: Skipping aggregation for {} because notes_data is not a valid dictionary.", full_notes_path)
+            except json.JSONDecodeError as outer_jde:
+                logger.error("Recap: Could not decode initial JSON from file: {}. Error: {}", full_notes_path, outer_jde)
             except FileNotFoundError:
-                print(f"ERROR: Recap: Notes file not found during aggregation: {full_notes_path}")
+                logger.error("Recap: Notes file not found during aggregation: {}", full_notes_path)
             except IOError as ioe:
-                print(f"ERROR: Recap: Could not read notes file during aggregation: {full_notes_path}. Error: {ioe}")
+                logger.error("Recap: Could not read notes file during aggregation: {}. Error: {}", full_notes_path, ioe)
             except Exception as agg_e:
-                print(f"ERROR: Recap: Unexpected error aggregating {full_notes_path}: {type(agg_e).__name__} - {agg_e}")
-        print(f"DEBUG: Recap: Aggregation complete.")
-        print(
-            f"DEBUG: Recap: Total Decisions: {len(all_decisions)}, Actions: {len(all_action_items)}, Risks: {len(all_risks)}, Questions: {len(all_open_questions)}")
-        llm_input_text = ""
-        report_sections = {
-            "Decisions Made": all_decisions,
-            "Action Items Assigned": all_action_items,
-            "Risks or Blockers Identified": all_risks,
-            "Open Questions Raised": all_open_questions
-        }
+                logger.error("Recap: Unexpected error aggregating {}: {} - {}", full_notes_path, type(agg_e).__name__, agg_e)
+        logger.debug("Recap: Aggregation complete.")
+        logger.debug("Recap: Total Decisions: {}, Actions: {}, Risks: {}, Questions: {}", len(all_decisions), len(all_action_items), len(all_risks), len(all_open_questions))
+        llm_parts = []
+        report_sections = (
+            ("Decisions Made", all_decisions),
+            ("Action Items Assigned", all_action_items),
+            ("Risks or Blockers Identified", all_risks),
+            ("Open Questions Raised", all_open_questions)
+        )
         has_content_for_llm = False
-        for title, items in report_sections.items():
-            unique_items = []
-            seen_items = set()
+        # One seen set across all sections: an item the LLM listed as both a decision and an action is only sent once,
+        # under the first section it appeared in
+        seen_lines = set()
+        for title, items in report_sections:
+            unique_lines = []
             if isinstance(items, list):
                 for item in items:
                     try:
-                        item_str = str(item).strip()
-                        if item_str and item_str not in seen_items:
-                            unique_items.append(item)
-                            seen_items.add(item_str)
+                        item_text = str(item).replace('\n', ' ').strip()
                     except Exception as str_e:
-                        print(f"WARNING: Could not convert item to string during deduplication: {str_e}")
-            if unique_items:
+                        logger.warning("Could not convert item to string during deduplication: {}", str_e)
+                        continue
+                    if item_text and item_text not in seen_lines:
+                        seen_lines.add(item_text)
+                        unique_lines.append(item_text)
+            if unique_lines:
                 has_content_for_llm = True
-                llm_input_text += f"#### {title}:\n"
-                for item in unique_items:
-                    try:
-                        item_text = str(item).replace('\n', ' ').strip()
-                        if item_text:
-                            llm_input_text += f"*   {item_text}\n"
-                    except Exception as format_e:
-                        llm_input_text += f"*   [Error formatting item: {format_e}]\n"
-                llm_input_text += "\n"
+                llm_parts.append(f"#### {title}:\n")
+                llm_parts.extend(f"*   {item_text}\n" for item_text in unique_lines)
+                llm_parts.append("\n")
+        llm_input_text = "".join(llm_parts)
         week_title_str = f"Week: {start_datetime.strftime('%B %d, %Y')} - {end_datetime.strftime('%B %d, %Y')}"
         if not has_content_for_llm:
-            print("DEBUG: Recap: No unique content found to send to LLM. Displaying basic message.")
+            logger.debug("Recap: No unique content found to send to LLM. Displaying basic message.")
             report_md = f"## Weekly Recap: {target_project}\n"
             report_md += f"### {week_title_str}\n\n"
             if processed_meeting_names:
@@ -1202,54 +2688,55 @@ class MeetingTranscriberApp(QMainWindow):
             self.update_status(f"Weekly recap generated: No items found for {target_project}.")
             self.generate_recap_button.setEnabled(True)
             self.generate_report_button.setEnabled(True)
-            print("DEBUG: Exiting generate_weekly_recap (no content for LLM).")
-            print("DEBUG: ============================================\n")
+            logger.debug("Exiting generate_weekly_recap (no content for LLM).")
+            logger.debug("============================================")
             return
-        print("DEBUG: Recap: Found content. Launching LLMRecapWorker...")
+        logger.debug("Recap: Found content. Launching LLMRecapWorker...")
         self.update_status(f"Generating narrative summary for {target_project}...")
-        QApplication.processEvents()
         worker = LLMRecapWorker(
             aggregated_bullets_text=llm_input_text,
             project_name=target_project,
             week_str=week_title_str,
             api_key=self.api_key
         )
+        self._recap_heading = (target_project, week_title_str)
+        worker.signals.recap_partial.connect(self.handle_recap_partial)
         worker.signals.recap_result.connect(self.handle_recap_result)
         worker.signals.error.connect(self.handle_recap_error)
-        self.threadpool.start(worker)
-        print("DEBUG: Recap: LLMRecapWorker submitted to threadpool.")
+        self.io_pool.start(worker)
+        logger.debug("Recap: LLMRecapWorker submitted to threadpool.")
+
+    def handle_recap_partial(self, partial_summary):
+        self._show_recap(partial_summary)
 
     def handle_recap_result(self, narrative_summary):
-        print("DEBUG: handle_recap_result received.")
-        target_project = self.report_project_edit.text().strip()
-        try:
-            today = datetime.now().date()
-            days_past_friday = (today.weekday() - 4) % 7
-            most_recent_friday = today - timedelta(days=days_past_friday)
-            start_of_recap_week_monday = most_recent_friday - timedelta(days=4)
-            week_title_str = f"Week: {start_of_recap_week_monday.strftime('%B %d, %Y')} - {most_recent_friday.strftime('%B %d, %Y')}"
-        except Exception:
-            week_title_str = "Last Week"
+        logger.debug("handle_recap_result received.")
+        target_project = self._show_recap(narrative_summary)
+        self.update_status(f"Weekly recap generated for {target_project}.")
+        self.generate_recap_button.setEnabled(True)
+        self.generate_report_button.setEnabled(True)
+        logger.debug("handle_recap_result finished.")
+        logger.debug("============================================")
+
+    def _show_recap(self, narrative_summary):
+        # Heading comes from generate_weekly_recap, so it matches the week the notes were aggregated for
+        target_project, week_title_str = self._recap_heading
         report_md = f"## Weekly Recap: {target_project}\n"
         report_md += f"### {week_title_str}\n\n"
         report_md += "#### Executive Summary:\n"
         report_md += narrative_summary
         report_md += "\n\n---\n"
         self.report_output_text.setMarkdown(report_md)
-        self.update_status(f"Weekly recap generated for {target_project}.")
-        self.generate_recap_button.setEnabled(True)
-        self.generate_report_button.setEnabled(True)
-        print("DEBUG: handle_recap_result finished.")
-        print("DEBUG: ============================================\n")
+        return target_project
 
     def handle_recap_error(self, error_message):
-        print(f"ERROR: handle_recap_error received: {error_message}")
+        logger.error("handle_recap_error received: {}", error_message)
         self.display_error(f"Failed to generate LLM narrative summary: {error_message}")
         self.update_status("Error generating weekly recap summary.")
         self.generate_recap_button.setEnabled(True)
         self.generate_report_button.setEnabled(True)
-        print("DEBUG: handle_recap_error finished.")
-        print("DEBUG: ============================================\n")
+        logger.debug("handle_recap_error finished.")
+        logger.debug("============================================")
 
     def init_ui(self):
         main_widget = QWidget();
@@ -1279,8 +2766,15 @@ class MeetingTranscriberApp(QMainWindow):
         history_pane_layout = QVBoxLayout(history_pane_widget)
         history_pane_layout.setContentsMargins(0, 0, 0, 0)
         history_pane_layout.addWidget(QLabel("Meeting History:"))
-        self.history_list = QListWidget()
-        self.history_list.itemClicked.connect(self.load_meeting_from_history)
+        self.history_model = MeetingListModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(HISTORY_SELECTION_DEBOUNCE_MS)
+        self._selection_timer.timeout.connect(self._load_current_history_selection)
+        self.history_list.selectionModel().currentChanged.connect(self._queue_history_selection)
         history_pane_layout.addWidget(self.history_list, 1)
 
         history_buttons_layout = QHBoxLayout()
@@ -1377,48 +2871,22 @@ class MeetingTranscriberApp(QMainWindow):
         self.status_label = QLabel("Ready.");
         main_layout.addWidget(self.status_label)
         self.setCentralWidget(main_widget);
+        self.status_label.setText("Loading meeting history...")
+        history_worker = HistoryLoadWorker(self.history)
+        history_worker.signals.finished.connect(self.handle_history_loaded)
+        history_worker.signals.error.connect(self.display_error)
+        self.threadpool.start(history_worker)
+
+    def handle_history_loaded(self):
         self.load_history_list()
+        self.update_status("Ready.")
 
     def update_status(self, message):
-        print(f"STATUS: {message}"); self.status_label.setText(message); QApplication.processEvents()
+        # repaint() draws the label now without re-entering the event loop, so no queued signals are delivered mid-handler
+        logger.info(message); self.status_label.setText(message); self.status_label.repaint()
 
     def display_error(self, message):
-        print(f"ERROR: {message}"); QMessageBox.warning(self, "Error", message); self.update_status(f"Error: {message}")
-
-    def _format_meeting_notes_md(self, meeting, notes_data):
-        md_string = ""
-        if not isinstance(notes_data, dict):
-            md_string += f"  *   **Notes Error:** Could not parse JSON notes for this meeting.\n"
-            return md_string
-        sections_to_include = {
-            "Decisions": notes_data.get("decisions", []),
-            "Action Items": notes_data.get("action_items", []),
-            "Risks": notes_data.get("risks", []),
-            "Open Questions": notes_data.get("open_questions", [])
-        }
-        has_content = False
-        meeting_md = ""
-        meeting_name = getattr(meeting, 'name', 'Unknown Meeting')
-        meeting_project = getattr(meeting, 'project_name', 'Unknown Project')
-        meeting_date = getattr(meeting, 'date', 'Unknown Date')
-        for title, items in sections_to_include.items():
-            if items and isinstance(items, list) and len(items) > 0:
-                has_content = True
-                meeting_md += f"  *   **{title}:**\n"
-                for item_index, item in enumerate(items):
-                    try:
-                        item_text = str(item).replace('\n', ' ')
-                        meeting_md += f"      *   {item_text}\n"
-                    except Exception as str_e:
-                        print(
-                            f"ERROR: Could not convert item {item_index} in section '{title}' of meeting {meeting_name} to string: {str_e}")
-                        meeting_md += f"      *   [Error converting item to string]\n"
-        if has_content:
-            md_string += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-            md_string += meeting_md
-        else:
-            print(f"DEBUG:   No content found in specified sections for {meeting_name}")
-        return md_string
+        logger.error(message); QMessageBox.warning(self, "Error", message); self.update_status(f"Error: {message}")
 
     def generate_standup_report(self):
         target_project = self.report_project_edit.text().strip()
@@ -1432,192 +2900,43 @@ class MeetingTranscriberApp(QMainWindow):
             _ = timedelta(hours=1)
         except NameError:
             self.display_error("FATAL: timedelta is not defined. Check imports.")
-            print("FATAL ERROR: timedelta is not defined. Check imports at the top of the file.")
+            logger.error("timedelta is not defined. Check imports at the top of the file.")
             return
         except Exception as e:
             self.display_error(f"FATAL: Error using timedelta: {e}")
-            print(f"FATAL ERROR: Error using timedelta: {e}")
+            logger.error("Error using timedelta: {}", e)
             return
         self.update_status(f"Generating stand-up notes for project: {target_project}...")
         self.generate_report_button.setEnabled(False)
         self.generate_recap_button.setEnabled(False)
         self.report_output_text.clear()
-        QApplication.processEvents()
-        hours_back = 120
-        now = datetime.now()
-        cutoff_time = now - timedelta(hours=hours_back)
-        target_project_lower = target_project.lower()
-        relevant_meetings = []
-        for i, meeting in enumerate(self.history.meetings):
-            meeting_id = getattr(meeting, 'meeting_id', 'N/A')
-            meeting_name = getattr(meeting, 'name', 'N/A')
-            try:
-                meeting_project_name = getattr(meeting, 'project_name', None)
-                meeting_date_str = getattr(meeting, 'date', None)
-                meeting_notes_path = getattr(meeting, 'json_notes_path', None)
-                if not meeting_project_name:
-                    continue
-                if not meeting_date_str:
-                    continue
-                if meeting_project_name.lower() == target_project_lower:
-                    meeting_date = datetime.strptime(meeting_date_str, "%Y-%m-%d %H:%M")
-                    if meeting_date >= cutoff_time:
-                        notes_path_exists = False
-                        if meeting_notes_path:
-                            if isinstance(meeting_notes_path, str) and meeting_notes_path.strip():
-                                try:
-                                    full_notes_path = os.path.abspath(meeting_notes_path)
-                                    notes_path_exists = os.path.exists(full_notes_path)
-                                except Exception as path_e:
-                                    print(f"ERROR: Could not check existence of path '{meeting_notes_path}': {path_e}")
-                                    notes_path_exists = False
-                            else:
-                                notes_path_exists = False
-                        if notes_path_exists:
-                            relevant_meetings.append(meeting)
-            except ValueError as ve:
-                print(
-                    f"ERROR: Could not parse date '{meeting_date_str}' for meeting '{meeting_name}' during report generation: {ve}. Skipping meeting.")
-            except AttributeError as ae:
-                print(
-                    f"ERROR: Meeting record for '{meeting_name}' might be missing attributes ({ae}). Skipping for report.")
-            except Exception as e:
-                print(
-                    f"ERROR: Unexpected error processing meeting {i} ('{meeting_name}'): {type(e).__name__} - {e}. Skipping meeting.")
-        if not relevant_meetings:
-            report_md = f"## Stand-up Notes: {target_project} (Last {hours_back} Hours)\n\n"
-            report_md += f"(No relevant meeting notes found with existing JSON files for this project in the specified time frame)"
-            self.report_output_text.setMarkdown(report_md)
-            self.update_status(f"Report generated: No relevant notes found for {target_project}.")
-            self.generate_report_button.setEnabled(True)
-            self.generate_recap_button.setEnabled(True)
-            return
-        try:
-            relevant_meetings.sort(key=lambda m: datetime.strptime(m.date, "%Y-%m-%d %H:%M"))
-        except Exception as e:
-            self.display_error(f"Error sorting meetings: {e}")
-            print(f"ERROR: Could not sort meetings: {e}")
-            self.generate_report_button.setEnabled(True)
-            self.generate_recap_button.setEnabled(True)
-            return
-        final_report_md = f"## Stand-up Notes: {target_project} (Last {hours_back} Hours)\n\n"
-        meetings_processed_count = 0
-        for meeting in relevant_meetings:
-            meeting_name = getattr(meeting, 'name', 'Unknown Meeting')
-            notes_path = getattr(meeting, 'json_notes_path', None)
-            meeting_project = getattr(meeting, 'project_name', 'Unknown Project')
-            meeting_date = getattr(meeting, 'date', 'Unknown Date')
-            if not notes_path:
-                continue
-            try:
-                if not isinstance(notes_path, str) or not notes_path.strip():
-                    print(f"ERROR: Invalid notes path type or empty for {meeting_name}: {notes_path}. Skipping file.")
-                    final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                    final_report_md += "  *   **Error:** Invalid notes file path stored.\n\n---\n\n"
-                    continue
-                full_notes_path = os.path.abspath(notes_path)
-                with open(full_notes_path, 'r', encoding='utf-8') as f:
-                    notes_content = f.read()
-                    notes_data = None
-                    if not notes_content.strip():
-                        print(f"WARNING: Notes file is empty: {full_notes_path}")
-                        notes_data = {}
-                    else:
-                        try:
-                            initial_data = json.loads(notes_content)
-                            print(
-                                f"DEBUG:   Initial JSON loaded. Keys: {list(initial_data.keys()) if isinstance(initial_data, dict) else 'Not a dict'}")
-                            if isinstance(initial_data, dict) and \
-                                    initial_data.get("error") == "LLM did not return valid JSON format." and \
-                                    "raw_output" in initial_data:
-                                raw_output_str = initial_data.get("raw_output", "")
-                                cleaned_str = raw_output_str.strip()
-                                if cleaned_str.startswith("```json"):
-                                    cleaned_str = cleaned_str[len("```json"):].strip()
-                                elif cleaned_str.startswith("```"):
-                                    cleaned_str = cleaned_str[len("```"):].strip()
-                                if cleaned_str.endswith("```"):
-                                    cleaned_str = cleaned_str[:-len("```")].strip()
-                                if not cleaned_str:
-                                    print("ERROR:   Cleaned raw_output string is empty.")
-                                    notes_data = {"error_parsing_raw": "Cleaned raw_output was empty"}
-                                else:
-                                    try:
-                                        notes_data = json.loads(cleaned_str)
-                                        print("DEBUG:   Successfully parsed JSON from cleaned raw_output.")
-                                    except json.JSONDecodeError as inner_jde:
-                                        print(f"ERROR:   Could not parse cleaned raw_output as JSON: {inner_jde}")
-                                        print(f"ERROR:   Cleaned Raw Output was: {cleaned_str}")
-                                        notes_data = {"error_parsing_raw": f"Failed to parse raw_output: {inner_jde}",
-                                                      "original_raw": cleaned_str}
-                            else:
-                                print(
-                                    "DEBUG:   Initial JSON seems valid (no specific error structure found). Using as notes_data.")
-                                notes_data = initial_data
-                        except json.JSONDecodeError as outer_jde:
-                            print(
-                                f"ERROR: Could not decode initial JSON from file: {full_notes_path}. Error: {outer_jde}")
-                            final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                            final_report_md += f"  *   **Error:** Could not read notes file (Invalid JSON): {outer_jde}.\n\n---\n\n"
-                            continue
-                    if notes_data is None:
-                        print(
-                            f"ERROR: notes_data is None after attempting to load/parse for {meeting_name}. Skipping formatting.")
-                        final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                        final_report_md += f"  *   **Error:** Failed to load or parse notes data structure.\n\n---\n\n"
-                        continue
-                    elif isinstance(notes_data, dict) and "error_parsing_raw" in notes_data:
-                        print(f"ERROR: Failed parsing raw_output for {meeting_name}. Skipping formatting.")
-                        final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                        final_report_md += f"  *   **Error:** Notes file contained an error structure and the raw data inside could not be parsed.\n\n---\n\n"
-                        continue
-                    print(
-                        f"DEBUG:   Final notes_data type: {type(notes_data)}, Keys: {list(notes_data.keys()) if isinstance(notes_data, dict) else 'Not a dict'}")
-                    meeting_md_snippet = self._format_meeting_notes_md(meeting, notes_data)
-                    print(f"DEBUG:   _format_meeting_notes_md returned snippet (len={len(meeting_md_snippet)}).")
-                    if meeting_md_snippet:
-                        final_report_md += meeting_md_snippet + "\n---\n\n"
-                        meetings_processed_count += 1
-                        print(f"DEBUG:   Added snippet to final report. Processed count: {meetings_processed_count}")
-                    else:
-                        print(f"DEBUG:   Snippet was empty, not added to report.")
-            except FileNotFoundError:
-                print(f"ERROR: Notes file not found during formatting: {full_notes_path}")
-                final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                final_report_md += "  *   **Error:** Notes file not found at specified path.\n\n---\n\n"
-            except IOError as ioe:
-                print(f"ERROR: Could not open or read notes file {full_notes_path} for report: {ioe}")
-                final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                final_report_md += f"  *   **Error:** Could not read notes file (IO Error): {ioe}.\n\n---\n\n"
-            except Exception as e:
-                print(
-                    f"ERROR: Unexpected error processing notes file {notes_path} or formatting meeting {meeting_name}: {type(e).__name__} - {e}")
-                final_report_md += f"### {meeting_name} ({meeting_project} - {meeting_date})\n"
-                final_report_md += f"  *   **Error:** Could not process notes file ({type(e).__name__}: {e}).\n\n---\n\n"
-        if meetings_processed_count == 0:
-            if relevant_meetings:
-                if "Error:" not in final_report_md[-500:]:
-                    final_report_md += "(No extracted Decisions, Action Items, Risks, or Questions found or processed successfully in relevant meetings)\n"
-        print("DEBUG: Setting final report markdown in UI...")
+        worker = StandupReportWorker(self.history, target_project, STANDUP_HOURS_BACK)
+        worker.signals.result.connect(self.handle_standup_report_result)
+        worker.signals.error.connect(self.handle_standup_report_error)
+        self.threadpool.start(worker)
+
+    def handle_standup_report_result(self, result):
+        final_report_md, status_message = result
+        logger.debug("Setting final report markdown in UI...")
         try:
             self.report_output_text.setMarkdown(final_report_md)
         except Exception as ui_e:
             try:
                 self.report_output_text.setPlainText(final_report_md)
             except Exception as ui_plain_e:
-                print(f"ERROR: Failed to set plain text in QTextEdit: {ui_plain_e}")
+                logger.error("Failed to set plain text in QTextEdit: {}", ui_plain_e)
                 self.report_output_text.setPlainText("Error: Could not display report content.")
-        self.update_status(f"Stand-up notes report generated for project '{target_project}'.")
+        self.update_status(status_message)
+        self.generate_report_button.setEnabled(True)
+        self.generate_recap_button.setEnabled(True)
+
+    def handle_standup_report_error(self, error_message):
+        self.display_error(error_message)
         self.generate_report_button.setEnabled(True)
         self.generate_recap_button.setEnabled(True)
 
     def load_history_list(self):
-        self.history_list.clear()
-        sorted_meetings = sorted(self.history.meetings, key=lambda m: m.date, reverse=True)
-        for meeting in sorted_meetings: item = QListWidgetItem(
-            f"{meeting.name} ({meeting.project_name} - {meeting.date})"); item.setData(Qt.UserRole,
-                                                                                       meeting.meeting_id); self.history_list.addItem(
-            item)
+        self.history_model.set_meetings(self.history.meetings)
         self.clear_history_displays();
         self.current_selected_meeting_id = None
 
@@ -1632,17 +2951,27 @@ class MeetingTranscriberApp(QMainWindow):
         self.delete_button.setEnabled(False);
         self.retry_button.setEnabled(False)
 
-    def load_meeting_from_history(self, item):
-        meeting_id = item.data(Qt.UserRole);
+    def _queue_history_selection(self, current, previous):
+        if current.isValid():
+            self._selection_timer.start()  # Restarts the countdown while the selection keeps moving
+        else:
+            self._selection_timer.stop()
+
+    def _load_current_history_selection(self):
+        index = self.history_list.currentIndex()
+        if index.isValid():
+            self.load_meeting_from_history(index)
+
+    def load_meeting_from_history(self, index):
+        meeting_id = index.data(Qt.UserRole);
         self.current_selected_meeting_id = meeting_id;
         self.delete_button.setEnabled(True)
-        meeting = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id), None)
+        meeting = self.history.get_meeting(self.current_selected_meeting_id)
         if not meeting: self.display_error("Selected meeting data not found."); self.clear_history_displays(); return
 
         can_retry = bool(meeting.full_audio_path and os.path.exists(meeting.full_audio_path));
         self.retry_button.setEnabled(can_retry)
-        if not can_retry: print(
-            f"Retry disabled: Full audio path missing or file not found ('{meeting.full_audio_path}')")
+        if not can_retry: logger.warning("Retry disabled: Full audio path missing or file not found ('{}')", meeting.full_audio_path)
 
         if meeting.project_name and meeting.project_name != "Unknown" and meeting.project_name.strip() != "":
             self.suggest_wiki_updates_button.setEnabled(True)
@@ -1655,27 +2984,16 @@ class MeetingTranscriberApp(QMainWindow):
         self.apply_wiki_changes_button.setEnabled(False)
         self.discard_wiki_suggestion_button.setEnabled(False)
 
-        try:
-            if meeting.transcript_path and os.path.exists(meeting.transcript_path):
-                with open(meeting.transcript_path, 'r', encoding='utf-8') as f:
-                    self.history_transcript.setText(f.read())
-            else:
-                self.history_transcript.setText("Transcript file not found.")
-        except Exception as e:
-            self.display_error(
-                f"Error loading transcript file {meeting.transcript_path}: {e}");
-            self.history_transcript.setText(
-                "Error loading transcript.")
-        try:
-            if meeting.summary_path and os.path.exists(meeting.summary_path):
-                with open(meeting.summary_path, 'r', encoding='utf-8') as f:
-                    self.history_summary.setHtml(markdown2.markdown(f.read()))
-            else:
-                self.history_summary.setText("Summary file not found.")
-        except Exception as e:
-            self.display_error(f"Error loading summary file {meeting.summary_path}: {e}");
-            self.history_summary.setText(
-                "Error loading summary.")
+        # Transcript and summary are read (and the summary rendered) off the GUI thread
+        self.history_transcript.setText("Loading transcript...")
+        self.history_summary.setText("Loading summary...")
+        wiki_file_path = None
+        if self.suggest_wiki_updates_button.isEnabled():
+            wiki_file_path = self._get_project_wiki_path(meeting.project_name)
+        wiki_sections = tuple(self.wiki_section_combo.itemText(i) for i in range(self.wiki_section_combo.count()))
+        files_worker = MeetingFilesLoadWorker(meeting, wiki_file_path, wiki_sections)
+        files_worker.signals.result.connect(self.handle_meeting_files_loaded)
+        self.threadpool.start(files_worker)
 
         # --- Mentor Feedback Loading Removed ---
         # try:
@@ -1690,17 +3008,28 @@ class MeetingTranscriberApp(QMainWindow):
         #     self.history_mentor_feedback.setText(
         #         "Error loading mentor feedback.")
 
+    def handle_meeting_files_loaded(self, result):
+        meeting_id, transcript_text, summary_html, summary_text, errors = result
+        if meeting_id != self.current_selected_meeting_id:
+            return  # The user moved on to another meeting (or cleared the selection) while this one loaded
+        self.history_transcript.setText(transcript_text)
+        if summary_html is not None:
+            self.history_summary.setHtml(summary_html)
+        else:
+            self.history_summary.setText(summary_text)
+        for error_message in errors:
+            self.display_error(error_message)
+
     def delete_selected_meeting(self):
         if not self.current_selected_meeting_id: return
-        meeting_to_delete = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id),
-                                 None)
+        meeting_to_delete = self.history.get_meeting(self.current_selected_meeting_id)
         if not meeting_to_delete: self.display_error("Cannot find meeting to delete."); return
         reply = QMessageBox.question(self, 'Confirm Delete', f"Delete '{meeting_to_delete.name}' and associated files?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.history.delete_meeting(self.current_selected_meeting_id):
                 self.update_status(
-                    f"Meeting '{meeting_to_delete.name}' deleted."); self.clear_history_displays(); self.current_selected_meeting_id = None; self.load_history_list()
+                    f"Meeting '{meeting_to_delete.name}' deleted."); self.history_list.setCurrentIndex(QModelIndex()); self.history_model.remove_meeting(self.current_selected_meeting_id); self.clear_history_displays(); self.current_selected_meeting_id = None
             else:
                 self.display_error(f"Failed to delete meeting '{meeting_to_delete.name}'.")
 
@@ -1711,8 +3040,7 @@ class MeetingTranscriberApp(QMainWindow):
         if self.processing_active:
             self.display_error("Another meeting processing is active. Please wait.")
             return
-        selected_meeting = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id),
-                                None)
+        selected_meeting = self.history.get_meeting(self.current_selected_meeting_id)
         if not selected_meeting: self.display_error("Selected meeting data not found."); return
         if not selected_meeting.project_name or selected_meeting.project_name == "Unknown" or selected_meeting.project_name.strip() == "":
             self.display_error(
@@ -1739,6 +3067,7 @@ class MeetingTranscriberApp(QMainWindow):
                         wf_new.write("## Key Features\n\n\n")
                         wf_new.write("## Daily Log\n\n\n")
                         wf_new.write("## Risks/Mitigations\n\n\n")
+                    _clear_wiki_caches()
                     self.update_status(f"Created template wiki: {os.path.basename(wiki_file_path)}")
                 except Exception as e_create:
                     self.display_error(f"Could not create template wiki: {e_create}")
@@ -1759,26 +3088,18 @@ class MeetingTranscriberApp(QMainWindow):
             else:
                 self.display_error("Neither transcript nor JSON notes found for the selected meeting.");
                 return
-        try:
-            with open(meeting_info_source_path, 'r', encoding='utf-8') as f_info:
-                meeting_info_text = f_info.read()
-        except Exception as e_read_info:
-            self.display_error(f"Error reading meeting info from {meeting_info_source_path}: {e_read_info}");
-            return
-        if not meeting_info_text.strip(): self.display_error("Meeting information (transcript/notes) is empty."); return
         self.update_status(
             f"Generating AI suggestion for '{target_section_title}' in '{project_name}' wiki (using {meeting_info_text_source})...")
         self.suggest_wiki_updates_button.setEnabled(False);
         self.apply_wiki_changes_button.setEnabled(False);
         self.discard_wiki_suggestion_button.setEnabled(False)
         self.wiki_suggestion_textedit.setPlaceholderText("AI is thinking...");
-        QApplication.processEvents()
-        worker = WikiUpdateSuggestionWorker(current_section_content, meeting_info_text, target_section_title,
+        worker = WikiUpdateSuggestionWorker(current_section_content, meeting_info_source_path, target_section_title,
                                             project_name, self.api_key)
         worker.signals.wiki_suggestion_result.connect(self._handle_wiki_suggestion_received)
         worker.signals.error.connect(self._handle_wiki_suggestion_error)
         worker.signals.finished.connect(self._handle_wiki_suggestion_finished)
-        self.threadpool.start(worker)
+        self.io_pool.start(worker)
 
     def _handle_wiki_suggestion_received(self, suggested_text, target_section_title):
         self.current_wiki_suggestion_target_section = target_section_title
@@ -1793,8 +3114,7 @@ class MeetingTranscriberApp(QMainWindow):
 
     def _handle_wiki_suggestion_finished(self):
         if self.current_selected_meeting_id:
-            selected_meeting = next(
-                (m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id), None)
+            selected_meeting = self.history.get_meeting(self.current_selected_meeting_id)
             if selected_meeting and selected_meeting.project_name and selected_meeting.project_name != "Unknown":
                 self.suggest_wiki_updates_button.setEnabled(True)
             else:
@@ -1806,8 +3126,7 @@ class MeetingTranscriberApp(QMainWindow):
         if not self.current_selected_meeting_id: self.display_error("Cannot apply: No meeting selected."); return
         if not self.current_wiki_suggestion_target_section: self.display_error(
             "Cannot apply: No active wiki suggestion."); return
-        selected_meeting = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id),
-                                None)
+        selected_meeting = self.history.get_meeting(self.current_selected_meeting_id)
         if not selected_meeting or not selected_meeting.project_name or selected_meeting.project_name == "Unknown":
             self.display_error("Cannot apply: Selected meeting or its project is invalid.");
             return
@@ -1822,27 +3141,30 @@ class MeetingTranscriberApp(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.No: self.update_status("Wiki update cancelled."); return
         self.update_status(f"Applying changes to '{target_section_title}' in '{project_name}' wiki...")
-        QApplication.processEvents()
-        success = False
-        if target_section_title.lower() == "daily log":
-            if new_section_content_from_llm.strip().lower() == "no new log entries from this meeting.":
-                self.update_status("No new log entries to add from this meeting.")
-                success = True
-            else:
-                success = self._update_daily_log_section(wiki_file_path, new_section_content_from_llm)
-        else:
-            success = self._replace_wiki_section(wiki_file_path, target_section_title, new_section_content_from_llm)
-        if success:
-            self.update_status(f"Wiki section '{target_section_title}' successfully updated.")
+        if (target_section_title.lower() == "daily log"
+                and new_section_content_from_llm.strip().lower() == "no new log entries from this meeting."):
+            self.update_status("No new log entries to add from this meeting.")
+            self.handle_wiki_write_result((target_section_title, True))
         else:
-            self.update_status(
-                f"Failed to update wiki section '{target_section_title}'. Check messages.")
+            worker = WikiWriteWorker(wiki_file_path, target_section_title, new_section_content_from_llm)
+            worker.signals.wiki_write_status.connect(self.update_status)
+            worker.signals.error.connect(self.display_error)
+            worker.signals.result.connect(self.handle_wiki_write_result)
+            self.wiki_pool.start(worker)
         self.wiki_suggestion_textedit.clear();
         self.wiki_suggestion_textedit.setPlaceholderText("AI suggestions will appear here...")
         self.apply_wiki_changes_button.setEnabled(False);
         self.discard_wiki_suggestion_button.setEnabled(False)
         self.current_wiki_suggestion_target_section = None
 
+    def handle_wiki_write_result(self, result):
+        target_section_title, success = result
+        if success:
+            self.update_status(f"Wiki section '{target_section_title}' successfully updated.")
+        else:
+            self.update_status(
+                f"Failed to update wiki section '{target_section_title}'. Check messages.")
+
     def handle_discard_wiki_suggestion(self):
         self.wiki_suggestion_textedit.clear()
         self.wiki_suggestion_textedit.setPlaceholderText("AI suggestions will appear here...")
@@ -1858,8 +3180,7 @@ class MeetingTranscriberApp(QMainWindow):
         if self.processing_active:
             self.display_error("Another meeting processing is already active. Please wait.")
             return
-        meeting_to_retry = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id),
-                                None)
+        meeting_to_retry = self.history.get_meeting(self.current_selected_meeting_id)
         if not meeting_to_retry:
             self.display_error("Could not find data for the selected meeting.")
             return
@@ -1882,7 +3203,6 @@ class MeetingTranscriberApp(QMainWindow):
         self.processing_active = True
         try:
             with wave.open(full_audio_path_to_retry, 'rb') as wf:
-                loaded_audio_data = wf.readframes(wf.getnframes())
                 loaded_sample_width = wf.getsampwidth()
                 if wf.getnchannels() != CHANNELS or wf.getframerate() != RATE:
                     self.display_error("Warning: Audio parameters in saved file differ from current settings.")
@@ -1897,7 +3217,7 @@ class MeetingTranscriberApp(QMainWindow):
         self.current_project_name = meeting_to_retry.project_name
         self.full_audio_file_path = full_audio_path_to_retry
         self.reset_processing_state()
-        self.start_post_processing(loaded_audio_data, loaded_sample_width)
+        self.start_post_processing(full_audio_path_to_retry, loaded_sample_width)
 
     def start_meeting(self):
         if self.is_recording: return
@@ -1913,11 +3233,16 @@ class MeetingTranscriberApp(QMainWindow):
         self.reset_processing_state()
         self.update_status(f"Starting meeting: {self.current_meeting_name} (Project: {self.current_project_name})")
         self.processing_active = True
-        self.recorder_thread = RecorderThread()
+        self.recorder_thread = RecorderThread(
+            self.current_meeting_id, os.path.join(WAVE_OUTPUT_FOLDER, f"{self.current_meeting_id}_full.wav"))
         self.recorder_thread.update_signal.connect(self.update_status)
+        self.recorder_thread.chunk_ready_signal.connect(self.handle_recorded_chunk)
+        self.recorder_thread.chunk_silent_signal.connect(self.handle_silent_chunk)
+        self.recorder_thread.chunk_failed_signal.connect(self.handle_failed_chunk)
         self.recorder_thread.recording_finished_signal.connect(
             self.start_post_processing)
         self.recorder_thread.start()
+        prewarm_connections(MAX_CONCURRENT_TRANSCRIPTIONS)
         self.is_recording = True
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -1932,8 +3257,14 @@ class MeetingTranscriberApp(QMainWindow):
 
     def reset_processing_state(self):
         self.pending_chunk_files = []
+        self.all_chunks_dispatched = False
         self.chunk_transcripts = {}
+        self.failed_chunks = set()
+        self._pending_outputs = set()
         self.transcriptions_done = 0
+        self._transcript_prefix = []
+        self._transcript_prefix_chars = 0
+        self._parts_prefetched = 0
         self.total_chunks = 0
         self.full_meeting_transcript = ""
         self.final_summary = ""
@@ -1946,23 +3277,36 @@ class MeetingTranscriberApp(QMainWindow):
     def handle_chunk_transcription_result(self, transcript_text, chunk_path, success=True):
         chunk_filename = os.path.basename(chunk_path)
         self.update_status(f"Received result for {chunk_filename} (Success: {success})")
-        try:
-            index_str = chunk_filename.split('_')[-1].split('.')[0]
-            chunk_index = int(index_str) - 1
-        except (IndexError, ValueError) as e:
-            print(f"ERROR: Could not parse chunk index from filename: {chunk_filename}. Error: {e}")
+        index_match = _CHUNK_INDEX_RE.search(chunk_filename)
+        if not index_match:
+            logger.error("Could not parse chunk index from filename: {}", chunk_filename)
             self.transcriptions_done += 1
             self.check_all_transcriptions_done()
             return
+        chunk_index = int(index_match.group(1)) - 1
         self.chunk_transcripts[chunk_index] = transcript_text
+        if success:
+            self.failed_chunks.discard(chunk_index)
+        else:
+            self.failed_chunks.add(chunk_index)
         self.transcriptions_done += 1
-        try:
-            if os.path.exists(chunk_path):
-                os.remove(chunk_path)
-        except OSError as e:
-            print(f"Warning: Could not delete audio chunk {chunk_path}: {e}")
+        self._advance_transcript_prefix()
         self.check_all_transcriptions_done()
 
+    def _advance_transcript_prefix(self):
+        """Extends the in-order transcript prefix and, once the meeting is long enough for map-reduce analysis,
+        starts analyzing the parts that can no longer change while later chunks are still being transcribed."""
+        while len(self._transcript_prefix) in self.chunk_transcripts:
+            text = self.chunk_transcripts[len(self._transcript_prefix)]
+            self._transcript_prefix.append(text)
+            self._transcript_prefix_chars += len(text) + 1
+        if self._transcript_prefix_chars < MAPREDUCE_MIN_CHARS or not self.analyzer.api_key:
+            return
+        parts = LLMMeetingAnalyzer._group_chunks(self._transcript_prefix)
+        for part in parts[self._parts_prefetched:-1]:  # The last part may still grow
+            self.analyzer.prefetch_part(part)
+        self._parts_prefetched = max(self._parts_prefetched, len(parts) - 1)
+
     def handle_chunk_transcription_error(self, error_message, chunk_path):
         chunk_filename = os.path.basename(chunk_path)
         self.display_error(f"Transcription error for {chunk_filename}: {error_message}")
@@ -1970,9 +3314,11 @@ class MeetingTranscriberApp(QMainWindow):
         self.handle_chunk_transcription_result(error_text, chunk_path, success=False)
 
     def check_all_transcriptions_done(self):
+        if not self.all_chunks_dispatched:
+            # Still recording: more chunks may arrive, so the total is not known yet
+            return
         if self.transcriptions_done >= self.total_chunks:
             self.update_status("All transcription chunks processed. Aggregating...")
-            QApplication.processEvents()
             self.aggregate_and_start_notes()
 
     def aggregate_and_start_notes(self):
@@ -1983,8 +3329,7 @@ class MeetingTranscriberApp(QMainWindow):
                 aggregated_parts.append(self.chunk_transcripts[i])
             else:
                 chunk_file_name_placeholder = f"{self.current_meeting_id}_chunk_{i + 1}.wav"
-                print(
-                    f"Warning: Transcript for chunk index {i} (expected file ~{chunk_file_name_placeholder}) was missing during aggregation.")
+                logger.warning("Transcript for chunk index {} (expected file ~{}) was missing during aggregation.", i, chunk_file_name_placeholder)
                 missing_chunks.append(i + 1)
                 aggregated_parts.append(f"[ERROR: Transcript missing for chunk {i + 1}]")
         if missing_chunks:
@@ -1999,8 +3344,9 @@ class MeetingTranscriberApp(QMainWindow):
             self.display_error(f"Error saving final transcript: {e}")
             self.finalize_meeting_processing(success=False)
             return
+        # Valid unless every chunk failed or went missing
         is_transcript_valid = bool(self.full_meeting_transcript) and \
-                              not all("[ERROR:" in part for part in aggregated_parts if isinstance(part, str))
+                              len(self.failed_chunks) + len(missing_chunks) < self.total_chunks
         if not is_transcript_valid:
             self.update_status(
                 "Transcript contains errors or is empty. Skipping JSON extraction and summary.")
@@ -2009,14 +3355,52 @@ class MeetingTranscriberApp(QMainWindow):
             # self.final_mentor_path = "" # <<< REMOVED
             self.finalize_meeting_processing(success=True)
             return
-        self.update_status("Starting JSON note extraction...");
-        QApplication.processEvents()
-        worker = JsonExtractionWorker(self.full_meeting_transcript, self.api_key)
+        self.update_status("Starting meeting analysis (notes + summary)...");
+        self._pending_outputs = {"notes", "summary"}
+        worker = MeetingAnalysisWorker(self.full_meeting_transcript, self.analyzer, aggregated_parts)
+        worker.signals.json_notes_result.connect(self.handle_final_notes)
+        worker.signals.summarization_result.connect(self.handle_final_summary)
+        worker.signals.error.connect(self.handle_meeting_analysis_error)
+        worker.signals.finished.connect(
+            lambda: logger.debug("MeetingAnalysisWorker finished signal received."))
+        self.io_pool.start(worker)
+
+    def handle_meeting_analysis_error(self, error_message):
+        # The combined structured-output call is unavailable (e.g. endpoint without json_schema support),
+        # so fall back to separate notes and summary requests. They don't depend on each other, so both run at once.
+        logger.warning("{} Falling back to separate notes and summary requests.", error_message)
+        self.update_status("Combined analysis failed. Starting JSON note extraction and summarization...");
+        self._pending_outputs = {"notes", "summary"}
+        worker = JsonExtractionWorker(self.full_meeting_transcript, self.json_extractor)
         worker.signals.json_notes_result.connect(self.handle_final_notes)
         worker.signals.error.connect(self.handle_final_notes_error)
         worker.signals.finished.connect(
-            lambda: print("DEBUG: JsonExtractionWorker finished signal received."))
-        self.threadpool.start(worker)
+            lambda: logger.debug("JsonExtractionWorker finished signal received."))
+        self.io_pool.start(worker)
+        self._start_summarization()
+
+    def _output_done(self, output_name):
+        if output_name not in self._pending_outputs:
+            return  # Late signal from a worker of an earlier run
+        self._pending_outputs.discard(output_name)
+        if not self._pending_outputs:
+            self.finalize_meeting_processing(success=True)
+
+    def _start_summarization(self):
+        self.update_status("Starting summarization...");
+        worker = SummarizationWorker(self.full_meeting_transcript, self.summarizer)
+        worker.signals.summarization_partial.connect(self.handle_summarization_partial)
+        worker.signals.summarization_result.connect(self.handle_final_summary)
+        worker.signals.error.connect(self.handle_final_summary_error)
+        worker.signals.finished.connect(
+            lambda: logger.debug("SummarizationWorker finished signal received."))
+        self.io_pool.start(worker)
+
+    def handle_summarization_partial(self, partial_summary):
+        # The streamed summary belongs to the meeting being processed; another meeting picked in history keeps its view
+        if self.current_selected_meeting_id not in (None, self.current_meeting_id):
+            return
+        self.history_summary.setMarkdown(partial_summary)
 
     def handle_final_notes(self, json_string):
         self.update_status("JSON note extraction complete.");
@@ -2024,36 +3408,24 @@ class MeetingTranscriberApp(QMainWindow):
         self.final_notes_path = f"{NOTES_FOLDER}/{self.current_meeting_id}_notes.json"
         try:
             try:
-                parsed = json.loads(json_string); pretty_json = json.dumps(parsed, indent=2)
+                parsed = json_loads(json_string)
             except json.JSONDecodeError:
-                pretty_json = json_string; self.display_error(
-                    "Warning: Failed to parse extracted notes as JSON, saved raw output.")
-            with open(self.final_notes_path, 'w', encoding='utf-8') as f:
-                f.write(pretty_json)
+                with open(self.final_notes_path, 'w', encoding='utf-8') as f:
+                    f.write(json_string)
+                self.display_error("Warning: Failed to parse extracted notes as JSON, saved raw output.")
+            else:
+                json_dump_file(parsed, self.final_notes_path, indent=True)
             self.update_status(f"JSON notes saved: {self.final_notes_path}")
         except IOError as e:
             self.display_error(f"Error saving JSON notes file: {e}"); self.final_notes_path = ""
-        self.update_status("Starting summarization...");
-        QApplication.processEvents()
-        worker = SummarizationWorker(self.full_meeting_transcript, self.api_key)
-        worker.signals.summarization_result.connect(self.handle_final_summary)
-        worker.signals.error.connect(self.handle_final_summary_error)
-        worker.signals.finished.connect(
-            lambda: print("DEBUG: SummarizationWorker finished signal received."))
-        self.threadpool.start(worker)
+        self._output_done("notes")
 
     def handle_final_notes_error(self, error_message):
         self.display_error(f"JSON note extraction failed: {error_message}");
         self.final_notes_json_string = "";
         self.final_notes_path = ""
-        self.update_status("JSON extraction failed. Starting summarization...");
-        QApplication.processEvents()
-        worker = SummarizationWorker(self.full_meeting_transcript, self.api_key)
-        worker.signals.summarization_result.connect(self.handle_final_summary)
-        worker.signals.error.connect(self.handle_final_summary_error)
-        worker.signals.finished.connect(
-            lambda: print("DEBUG: SummarizationWorker (after notes error) finished signal received."))
-        self.threadpool.start(worker)
+        self.update_status("JSON extraction failed.");
+        self._output_done("notes")
 
     def handle_final_summary(self, summary_text):
         self.update_status("Summarization complete.");
@@ -2068,8 +3440,7 @@ class MeetingTranscriberApp(QMainWindow):
             self.final_summary_path = ""
 
         # --- Mentor Feedback Worker Call Removed ---
-        # Directly finalize processing
-        self.finalize_meeting_processing(success=True)
+        self._output_done("summary")
 
     def handle_final_summary_error(self, error_message):
         self.display_error(f"Summarization failed: {error_message}");
@@ -2077,18 +3448,20 @@ class MeetingTranscriberApp(QMainWindow):
         self.final_summary_path = ""
 
         # --- Mentor Feedback Worker Call Removed ---
-        # Directly finalize processing
-        self.finalize_meeting_processing(success=True)
+        self._output_done("summary")
 
     # --- handle_mentor_feedback and handle_mentor_feedback_error REMOVED ---
 
     def finalize_meeting_processing(self, success=True):
         self.update_status("Finalizing meeting processing...")
-        QApplication.processEvents()
         transcript_path_valid = bool(self.final_transcript_path and os.path.exists(self.final_transcript_path))
         meeting_id_valid = bool(self.current_meeting_id)
 
         if success and transcript_path_valid and meeting_id_valid:
+            existing_meeting = self.history.get_meeting(self.current_meeting_id)
+            # Chunks are transcribed from memory, so no chunk files are written; a retried legacy meeting
+            # keeps None so its old chunk files are still found on delete
+            chunk_paths = None if existing_meeting is not None and existing_meeting.chunk_paths is None else []
             updated_meeting_data = MeetingData(
                 self.current_meeting_id,
                 self.current_meeting_name,
@@ -2098,21 +3471,17 @@ class MeetingTranscriberApp(QMainWindow):
                 self.final_transcript_path,
                 # self.final_mentor_path, # <<< REMOVED
                 self.full_audio_file_path,
-                self.final_notes_path
+                self.final_notes_path,
+                chunk_paths
             )
-            existing_meeting_index = -1
-            for idx, meeting in enumerate(self.history.meetings):
-                if meeting.meeting_id == self.current_meeting_id:
-                    existing_meeting_index = idx
-                    break
-            if existing_meeting_index != -1:
-                self.history.meetings[existing_meeting_index] = updated_meeting_data
+            if self.history.upsert_meeting(updated_meeting_data):
                 self.update_status(f"Meeting '{self.current_meeting_name}' processing results updated.")
             else:
-                self.history.add_meeting(updated_meeting_data)
                 self.update_status(f"Meeting '{self.current_meeting_name}' processed and saved.")
-            self.history.save_history()
-            self.load_history_list()
+            self.history_model.upsert_meeting(updated_meeting_data)
+            self.history_list.setCurrentIndex(QModelIndex())
+            self.clear_history_displays()
+            self.current_selected_meeting_id = None
         elif not success:
             self.update_status(f"Meeting '{self.current_meeting_name}' processing FAILED. Check logs.")
         else:
@@ -2121,7 +3490,7 @@ class MeetingTranscriberApp(QMainWindow):
 
         self.is_recording = False
         if self.recorder_thread and self.recorder_thread.isRunning():
-            print("Warning: Recorder thread still running during finalize. Attempting to stop again.")
+            logger.warning("Recorder thread still running during finalize. Attempting to stop again.")
             self.recorder_thread.quit()
             self.recorder_thread.wait(1000)
         self.recorder_thread = None
@@ -2132,17 +3501,16 @@ class MeetingTranscriberApp(QMainWindow):
         self.project_name_edit.setReadOnly(False)
         if self.current_selected_meeting_id:
             self.delete_button.setEnabled(True)
-            meeting = next((m for m in self.history.meetings if m.meeting_id == self.current_selected_meeting_id), None)
+            meeting = self.history.get_meeting(self.current_selected_meeting_id)
             can_retry_now = bool(meeting and meeting.full_audio_path and os.path.exists(meeting.full_audio_path))
             self.retry_button.setEnabled(can_retry_now)
         else:
             self.delete_button.setEnabled(False)
             self.retry_button.setEnabled(False)
-        print("DEBUG: Finalize_meeting_processing complete.")
+        logger.debug("Finalize_meeting_processing complete.")
 
     def closeEvent(self, event):
         self.update_status("Attempting to close application...")
-        QApplication.processEvents()
         if self.is_recording:
             reply = QMessageBox.question(self, 'Exit Confirmation',
                                          'A meeting is currently recording. Stop recording and exit? (Current meeting processing will be cancelled)',
@@ -2153,10 +3521,7 @@ class MeetingTranscriberApp(QMainWindow):
                 self.processing_active = False
                 self.is_recording = False
                 self.update_status("Recording stopped. Shutting down threads...")
-                QApplication.processEvents()
-                self.threadpool.clear()
-                if not self.threadpool.waitForDone(2000):
-                    print("Warning: Not all threads finished cleanly on exit.")
+                self._shutdown_workers()
                 event.accept()
             else:
                 event.ignore()
@@ -2169,10 +3534,7 @@ class MeetingTranscriberApp(QMainWindow):
             if reply == QMessageBox.Yes:
                 self.processing_active = False
                 self.update_status("Processing stopped. Shutting down threads...")
-                QApplication.processEvents()
-                self.threadpool.clear()
-                if not self.threadpool.waitForDone(2000):
-                    print("Warning: Not all threads finished cleanly on exit.")
+                self._shutdown_workers()
                 event.accept()
             else:
                 event.ignore()
@@ -2180,219 +3542,61 @@ class MeetingTranscriberApp(QMainWindow):
                 return
         else:
             self.update_status("Shutting down threads...")
-            QApplication.processEvents()
-            if not self.threadpool.waitForDone(1000):
-                print("Warning: Minor thread activity on close, but no major processing was active.")
+            self._shutdown_workers()
             event.accept()
 
+    def _shutdown_workers(self):
+        # Nothing here blocks the GUI thread: queued runnables are dropped and running workers stop at their next
+        # API request or streamed delta (see SHUTDOWN_EVENT). Confirmed wiki edits are kept for _finish_pending_writes.
+        SHUTDOWN_EVENT.set()
+        self.threadpool.clear()
+        self.io_pool.clear()
+        self.analyzer.shutdown()
+
+    def _finish_pending_writes(self):
+        """aboutToQuit slot: lets the recorder close its WAV file and queued wiki edits land before exit.
+        Both are local file writes, unlike the network work _shutdown_workers abandons."""
+        if self.recorder_thread is not None:
+            self.recorder_thread.wait()
+        self.wiki_pool.waitForDone()
+
     def _get_project_wiki_path(self, project_name_or_id):
         if not project_name_or_id:
             return None
-        filename_project_name = "".join(
-            c if c.isalnum() or c in [' ', '-'] else '_' for c in project_name_or_id).strip().replace(' ', '_')
-        if not filename_project_name:
-            filename_project_name = "default_project"
-        os.makedirs(PROJECT_WIKIS_FOLDER, exist_ok=True)
+        if project_name_or_id.isascii():
+            filename_project_name = project_name_or_id.translate(_SAFE_NAME_TABLE)
+        else:  # Non-ASCII letters are kept too, so they need the per-character isalnum()
+            filename_project_name = "".join(
+                c if c.isalnum() or c in ' -' else '_' for c in project_name_or_id)
+        filename_project_name = filename_project_name.strip().replace(' ', '_') or "default_project"
         return os.path.join(PROJECT_WIKIS_FOLDER, f"{filename_project_name}_wiki.md")
 
     def _read_wiki_section(self, wiki_file_path, section_title):
-        if not wiki_file_path or not os.path.exists(wiki_file_path):
-            print(f"Wiki file not found (or path is None) for reading section: {wiki_file_path}")
+        if not wiki_file_path:
+            logger.info("Wiki file path is None; no section to read.")
             return None
         try:
-            with open(wiki_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            section_content = _wiki_section_cached(wiki_file_path, _wiki_file_version(wiki_file_path), section_title)
+        except FileNotFoundError:
+            logger.info("Wiki file not found for reading section: {}", wiki_file_path)
+            return None
         except Exception as e:
             self.display_error(f"Error reading wiki file {wiki_file_path}: {e}")
             return None
-        section_content_lines = []
-        in_section = False
-        import re
-        target_header_pattern = re.compile(r"^\s*#+\s*" + re.escape(section_title) + r"\s*$", re.IGNORECASE)
-        next_major_header_pattern = re.compile(r"^\s*##\s+.*")
-        for i, line in enumerate(lines):
-            if not in_section and target_header_pattern.match(line):
-                in_section = True
-                continue
-            if in_section:
-                is_next_major_header = next_major_header_pattern.match(line)
-                if is_next_major_header and not target_header_pattern.match(line):
-                    break
-                section_content_lines.append(line)
-        if not in_section:
-            print(f"Section '{section_title}' not found in {wiki_file_path}. Assuming empty content.")
+        if section_content is None:
+            logger.info("Section '{}' not found in {}. Assuming empty content.", section_title, wiki_file_path)
             return ""
-        return "".join(section_content_lines).strip()
-
-    def _replace_wiki_section(self, wiki_file_path, section_title, new_section_content):
-        if new_section_content and not new_section_content.endswith('\n'):
-            new_section_content += '\n'
-        if not new_section_content:
-            new_section_content = '\n'
-        import re
-        target_header_pattern_search = re.compile(r"^\s*(#+)\s*" + re.escape(section_title) + r"\s*$", re.IGNORECASE)
-        header_level_to_write = "##"
-        lines = []
-        file_existed = os.path.exists(wiki_file_path)
-        if file_existed:
-            try:
-                with open(wiki_file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            except Exception as e:
-                self.display_error(f"Error reading wiki file {wiki_file_path} for replacement: {e}")
-                return False
-        if file_existed:
-            for line_check in lines:
-                match = target_header_pattern_search.match(line_check)
-                if match:
-                    header_level_to_write = match.group(1)
-                    break
-        new_full_section_text = f"{header_level_to_write} {section_title}\n{new_section_content}"
-        if not file_existed:
-            try:
-                with open(wiki_file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_full_section_text)
-                self.update_status(f"Created new wiki file with section: {os.path.basename(wiki_file_path)}")
-                return True
-            except Exception as e:
-                self.display_error(f"Error creating new wiki file {os.path.basename(wiki_file_path)}: {e}")
-                return False
-        output_lines = []
-        in_section_to_replace = False
-        section_replaced_or_found = False
-        any_header_pattern = re.compile(r"^\s*#+\s+.*")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if target_header_pattern_search.match(line):
-                if not section_replaced_or_found:
-                    output_lines.append(new_full_section_text)
-                    section_replaced_or_found = True
-                    in_section_to_replace = True
-                i += 1
-                continue
-            if in_section_to_replace:
-                if any_header_pattern.match(line):
-                    in_section_to_replace = False
-                    output_lines.append(line)
-            else:
-                output_lines.append(line)
-            i += 1
-        if not section_replaced_or_found:
-            if output_lines and output_lines[-1].strip() != "":
-                if not output_lines[-1].endswith('\n'): output_lines[-1] += '\n'
-                output_lines.append('\n')
-            output_lines.append(new_full_section_text)
-            self.update_status(f"Section '{section_title}' appended to wiki.")
-        try:
-            with open(wiki_file_path, 'w', encoding='utf-8') as f:
-                f.writelines(output_lines)
-            self.update_status(f"Wiki section '{section_title}' updated in {os.path.basename(wiki_file_path)}")
-            return True
-        except Exception as e:
-            self.display_error(f"Error writing updated wiki file {os.path.basename(wiki_file_path)}: {e}")
-            return False
-
-    def _update_daily_log_section(self, wiki_file_path, new_log_entry_text, entry_date_str=None):
-        if not new_log_entry_text.strip() or new_log_entry_text.strip().lower() == "no new log entries from this meeting.":
-            self.update_status("Daily log update skipped: New entry text is empty or indicates no new entries.")
-            return True
-        if entry_date_str is None:
-            entry_date_str = datetime.now().strftime("%Y-%m-%d")
-        daily_log_main_header = "## Daily Log"
-        date_subheader = f"### {entry_date_str}"
-        lines_of_new_entry = new_log_entry_text.strip().split('\n')
-        formatted_new_entry_lines = []
-        for line in lines_of_new_entry:
-            stripped_line = line.strip()
-            if stripped_line and not stripped_line.startswith(("* ", "- ", "### ")):
-                formatted_new_entry_lines.append(f"- {stripped_line}")
-            elif stripped_line:
-                formatted_new_entry_lines.append(line)
-        new_log_entry_block = "\n".join(formatted_new_entry_lines)
-        if not new_log_entry_block.endswith('\n'):
-            new_log_entry_block += '\n'
-        lines = []
-        file_existed = os.path.exists(wiki_file_path)
-        if file_existed:
-            try:
-                with open(wiki_file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            except Exception as e:
-                self.display_error(f"Error reading wiki file {os.path.basename(wiki_file_path)} for daily log: {e}")
-                return False
-        output_lines = []
-        daily_log_section_found = False
-        import re
-        daily_log_header_pattern = re.compile(r"^\s*##\s*Daily Log\s*$", re.IGNORECASE)
-        date_subheader_pattern = re.compile(r"^\s*###\s*" + re.escape(entry_date_str) + r"\s*$", re.IGNORECASE)
-        any_h2_header_pattern = re.compile(r"^\s*##\s+.*")
-        any_h3_header_pattern = re.compile(r"^\s*###\s+.*")
-        daily_log_start_index = -1
-        today_date_header_index = -1
-        first_h3_after_daily_log_index = -1
-        for i, line in enumerate(lines):
-            if daily_log_header_pattern.match(line):
-                daily_log_section_found = True
-                daily_log_start_index = i
-                for j in range(i + 1, len(lines)):
-                    line_j = lines[j]
-                    if any_h2_header_pattern.match(line_j):
-                        break
-                    if date_subheader_pattern.match(line_j):
-                        today_date_header_index = j
-                        break
-                    if first_h3_after_daily_log_index == -1 and any_h3_header_pattern.match(line_j):
-                        first_h3_after_daily_log_index = j
-                break
-        if not daily_log_section_found:
-            output_lines.extend(lines)
-            if output_lines and output_lines[-1].strip() != "":
-                if not output_lines[-1].endswith('\n'): output_lines[-1] += '\n'
-                output_lines.append('\n')
-            output_lines.append(f"{daily_log_main_header}\n")
-            output_lines.append(f"{date_subheader}\n")
-            output_lines.append(new_log_entry_block)
-        else:
-            if today_date_header_index != -1:
-                output_lines.extend(lines[:today_date_header_index + 1])
-                output_lines.append(new_log_entry_block)
-                for k in range(today_date_header_index + 1, len(lines)):
-                    line_k = lines[k]
-                    if any_h3_header_pattern.match(line_k) or any_h2_header_pattern.match(line_k):
-                        output_lines.extend(lines[k:])
-                        break
-                    output_lines.append(line_k)
-                else:
-                    pass
-            else:
-                insert_at = daily_log_start_index + 1
-                if first_h3_after_daily_log_index != -1:
-                    insert_at = first_h3_after_daily_log_index
-                output_lines.extend(lines[:insert_at])
-                output_lines.append(f"{date_subheader}\n")
-                output_lines.append(new_log_entry_block)
-                if insert_at < len(lines) and lines[insert_at].strip() != "" and not new_log_entry_block.endswith(
-                        "\n\n"):
-                    if not new_log_entry_block.endswith("\n"): output_lines[
-                        -1] += "\n"
-                    output_lines.append("\n")
-                output_lines.extend(lines[insert_at:])
-        try:
-            with open(wiki_file_path, 'w', encoding='utf-8') as f:
-                f.writelines(output_lines)
-            self.update_status(f"Daily log updated in {os.path.basename(wiki_file_path)} for {entry_date_str}")
-            return True
-        except Exception as e:
-            self.display_error(f"Error writing updated wiki file {os.path.basename(wiki_file_path)}: {e}")
-            return False
+        return section_content
 
 
 # --- Main Execution Block ---
 if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_LEVEL)
     app = QApplication(sys.argv)
     app.setApplicationName("Meeting Summarizer & Coach v2")
     window = MeetingTranscriberApp()
+    app.aboutToQuit.connect(window._finish_pending_writes)
     window.show()
     sys.exit(app.exec_())
 